@@ -1,25 +1,23 @@
 import sys
 import subprocess
 import os
-import whisper # OpenAI's Whisper
-import torch
-import tempfile
+import stat
+import numpy as np # Vectorized timestamp formatting
 import shutil
 import logging # For logging
+import logging.handlers # For buffered monitor event logging
 import datetime # For timestamps
 import traceback # For error tracebacks
 import time # For timing
 import threading
-import win32api
-import win32file
-import win32con
+import queue
+import sqlite3 # Persistent processed-file markers for folder monitors
+import contextlib
+from concurrent.futures import ThreadPoolExecutor # Shared transcription pool for folder monitors
 import socket
-import configparser # For configuration file
+from functools import lru_cache # For the Whisper model cache
 from pathlib import Path
-# Import video_frame_snatcher module
-from video_frame_snatcher import VideoFrameSnatcher
-# Import YouTube Caption Fetcher
-from youtube_captionfetcher import YouTubeCaptionFetcher
+import importlib # Tool windows and watchdog are imported on first use (see lazy_attr)
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
@@ -27,12 +25,35 @@ from PySide6.QtWidgets import (
     QSpacerItem, QSizePolicy, QRadioButton, QButtonGroup, QMenuBar, QMenu,
     QMainWindow, QDialog, QLineEdit, QSystemTrayIcon, QStatusBar, QToolTip
 )
-from PySide6.QtCore import Qt, QThread, Signal, QObject, QTimer, QEvent
+from PySide6.QtCore import Qt, QThread, Signal, Slot, QObject, QTimer, QEvent, QSettings, QProcess, QFileInfo, QStandardPaths
 from PySide6.QtGui import QIntValidator, QIcon, QAction
 
 # --- Global Variables & Constants ---
 APP_VERSION = "1.4.5_ParanoidLogPath_OriginalGUI"
+try: SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__)) # Resolved once; icons, tools and monitor files live here
+except NameError: SCRIPT_DIR = os.getcwd()
+DEFAULT_ICON_PATH = os.path.join(SCRIPT_DIR, "WhisperCreepICO.ico")
+HOME_DIR = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.HomeLocation) # Start folder for file pickers
 transcription_in_progress = False
+WHISPER_BACKENDS = ["faster-whisper", "openai-whisper"]
+DEFAULT_WHISPER_BACKEND = "faster-whisper"
+PRECISION_OPTIONS = ["auto", "fp16", "int8", "fp32"]
+DECODING_OPTIONS = ["fast", "accurate"] # fast: VAD-trimmed silence + greedy decoding; accurate: beam search
+DEFAULT_DECODING = "fast"
+WARMUP_ON_LOAD = True # Decode 30 s of silence right after a model load so kernel selection isn't paid on the first file
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi', '.wmv', '.mkv')
+SHORT_CLIP_SECONDS = 30 # Monitor clips shorter than this go to the lighter short-clip model
+SHORT_CLIP_MODELS = ["tiny", "tiny.en", "base", "base.en"] # ".en" variants are English-only, so they're an explicit opt-in
+DEFAULT_SHORT_CLIP_MODEL = "tiny"
+_MODEL_SIZE_RANK = {"tiny": 0, "base": 1, "small": 2, "medium": 3, "large": 4} # ".en" variants share their base size
+VIDEO_EXTS = frozenset(ext.lstrip('.') for ext in VIDEO_EXTENSIONS) # For DirEntry.name.rpartition('.') lookups
+
+_SETTINGS = QSettings("WhisperCreep", "WhisperCreep") # Registry on Windows; holds the custom icon and last monitor settings
+
+# Heavy ASR modules (torch pulls in the CUDA runtime) are imported on first use by import_asr_modules()
+whisper = None # OpenAI's Whisper
+torch = None
+WhisperModel = None # CTranslate2 Whisper backend (faster-whisper)
 
 # --- Setup Python Logging (Initial: Console Only) ---
 # FileHandler will be added dynamically per run.
@@ -48,9 +69,7 @@ logger_app = logging.getLogger("WhisperCreepApp.GUI")
 logger_worker = logging.getLogger("WhisperCreepApp.Worker")
 
 logger_app.info(f"--- LOGGER INITIALIZED (Console Only). SCRIPT STARTING. Version: {APP_VERSION} ---")
-try: SCRIPT_DIR_FOR_INFO = os.path.dirname(os.path.abspath(__file__))
-except NameError: SCRIPT_DIR_FOR_INFO = os.getcwd()
-logger_app.info(f"Script directory (for info): {SCRIPT_DIR_FOR_INFO}")
+logger_app.info(f"Script directory (for info): {SCRIPT_DIR}")
 logger_app.info(f"Current working directory: {os.getcwd()}")
 logger_app.info("Run-specific file logging will be set up in Downloads folder when processing starts.")
 
@@ -60,49 +79,355 @@ class TranscriptionStateManager(QObject):
     
     def __init__(self):
         super().__init__()
-        self._lock = threading.Lock()
-        self._state = False
-        self._active_monitors = set()
+        self._event = threading.Event()  # Set while a manual transcription runs; reads need no lock
+        self._idle_cond = threading.Condition()  # Notified when the state flips or a waiter's cancel event is set
+        self._active_monitors = set()  # set.add/discard are atomic under the GIL
     
     @property
     def is_transcribing(self):
-        with self._lock:
-            return self._state
+        return self._event.is_set()
     
     def set_transcribing(self, value):
-        with self._lock:
-            old_state = self._state
-            self._state = value
-            if old_state != value:
-                self.state_changed.emit(value)
+        value = bool(value)
+        if self._event.is_set() == value:
+            return
+        self._event.set() if value else self._event.clear()
+        self.wake_waiters()
+        self.state_changed.emit(value)
+
+    def wait_until_idle(self, timeout=None, cancel=None):
+        """Block until no manual transcription is running or cancel (an Event) is set; returns False on timeout."""
+        with self._idle_cond:
+            return self._idle_cond.wait_for(lambda: not self._event.is_set() or (cancel is not None and cancel.is_set()), timeout)
+
+    def wake_waiters(self):
+        """Re-checks every wait_until_idle() call, e.g. after setting a waiter's cancel event."""
+        with self._idle_cond: self._idle_cond.notify_all()
     
     def register_monitor(self, monitor_id):
-        with self._lock:
-            self._active_monitors.add(monitor_id)
-            return len(self._active_monitors)
+        self._active_monitors.add(monitor_id)
+        return len(self._active_monitors)
     
     def unregister_monitor(self, monitor_id):
-        with self._lock:
-            self._active_monitors.discard(monitor_id)
-            return len(self._active_monitors)
+        self._active_monitors.discard(monitor_id)
+        return len(self._active_monitors)
+
+    @property
+    def active_monitor_count(self):
+        return len(self._active_monitors)
 
 # Create global state manager instance
 transcription_state = TranscriptionStateManager()
 
 # --- Helper Functions ---
+if os.name == 'nt':
+    # Win32 entry points resolved once with explicit signatures, instead of a windll lookup per call
+    import ctypes
+    from ctypes import wintypes
+    _GetConsoleWindow = ctypes.windll.kernel32.GetConsoleWindow; _GetConsoleWindow.argtypes = []; _GetConsoleWindow.restype = wintypes.HWND
+    _SetForegroundWindow = ctypes.windll.user32.SetForegroundWindow; _SetForegroundWindow.argtypes = [wintypes.HWND]; _SetForegroundWindow.restype = wintypes.BOOL
+    _ShowWindow = ctypes.windll.user32.ShowWindow; _ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]; _ShowWindow.restype = wintypes.BOOL
+    _SW_RESTORE = 9
+
+_LAZY = {} # (module, attribute) -> object, filled by lazy_attr
+
+def lazy_attr(module, name):
+    """Imports module on first use and returns module.name, keeping tool windows and watchdog off the startup path."""
+    key = (module, name)
+    if key not in _LAZY: _LAZY[key] = getattr(importlib.import_module(module), name)
+    return _LAZY[key]
+
 def bring_console_to_front():
     if os.name == 'nt':
         try:
-            from ctypes import windll
-            hwnd = windll.kernel32.GetConsoleWindow()
-            if hwnd: windll.user32.SetForegroundWindow(hwnd); windll.user32.ShowWindow(hwnd, 9)
+            hwnd = _GetConsoleWindow()
+            if hwnd: _SetForegroundWindow(hwnd); _ShowWindow(hwnd, _SW_RESTORE)
         except Exception as e: logger_app.warning(f"Could not bring console to front: {e}", exc_info=False)
 
+DWMWA_USE_IMMERSIVE_DARK_MODE = 20
+
+def apply_dark_title_bar(hwnd):
+    """Asks DWM to draw a window's title bar and frame dark (Windows only); returns whether it succeeded."""
+    try: return ctypes.windll.dwmapi.DwmSetWindowAttribute(wintypes.HWND(hwnd), DWMWA_USE_IMMERSIVE_DARK_MODE, ctypes.byref(ctypes.c_int(1)), ctypes.sizeof(ctypes.c_int)) == 0
+    except Exception as e: logger_app.warning(f"Could not apply dark mode to window: {e}"); return False
+
 def format_timestamp_for_transcript(seconds: float) -> str:
     abs_seconds = abs(seconds); hours = int(abs_seconds / 3600); minutes = int((abs_seconds % 3600) / 60)
     secs = int(abs_seconds % 60); millis = int((abs_seconds - int(abs_seconds)) * 1000)
     return f"{'-' if seconds < 0 else ''}{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
 
+def format_timestamps_bulk(arr: np.ndarray) -> list[str]:
+    """Vectorized format_timestamp_for_transcript: formats a whole array of seconds in one pass."""
+    arr = np.asarray(arr, dtype=np.float64); abs_arr = np.abs(arr); whole = abs_arr.astype(np.int64)
+    h, rem = np.divmod(whole, 3600); m, s = np.divmod(rem, 60)
+    ms = ((abs_arr - whole) * 1000).astype(np.int64); signs = np.where(arr < 0, '-', '').tolist()
+    return [f"{sg}{hh:02d}:{mm:02d}:{ss:02d}.{mi:03d}" for sg, hh, mm, ss, mi in zip(signs, h.tolist(), m.tolist(), s.tolist(), ms.tolist())]
+
+def format_transcript(segments) -> str:
+    """Renders segments as '[start --> end] text' lines in one string (blank segments skipped; "" if all are blank)."""
+    times = np.fromiter((t for seg in segments for t in (seg['start'], seg['end'])), dtype=np.float64, count=2 * len(segments))
+    stamps = format_timestamps_bulk(times) # One vectorized pass over interleaved start/end times
+    texts = [seg['text'].strip() for seg in segments]
+    return "".join([f"[{start} --> {end}] {text}\n" for start, end, text in zip(stamps[0::2], stamps[1::2], texts) if text])
+
+_MODEL_CACHE_LOCK = threading.Lock() # Serializes model loads across the GUI worker and monitor threads
+_OPENAI_INFERENCE_LOCK = threading.Lock() # openai-whisper installs kv-cache hooks on the shared model per transcribe() call
+
+def import_asr_modules():
+    """Imports torch, whisper and faster-whisper on first call so the GUI opens without loading them."""
+    global whisper, torch, WhisperModel
+    if WhisperModel is None:
+        import torch, whisper
+        from faster_whisper import WhisperModel
+        if torch.cuda.is_available():
+            torch.backends.cudnn.benchmark = True # Whisper's mel input shape is fixed, so cuDNN's one-time algorithm pick pays off
+            torch.set_float32_matmul_precision("high") # Allow TF32 for any matmuls still running in fp32
+
+def cuda_available():
+    import_asr_modules(); return torch.cuda.is_available()
+
+def resolve_compute_type(precision, device):
+    """Maps a GUI precision choice to a CTranslate2-style compute_type the device supports."""
+    if precision == "fp32" or (precision == "fp16" and device != "cuda"): return "float32" # No FP16 kernels on CPU
+    if precision == "int8": return "int8_float16" if device == "cuda" else "int8"
+    return "float16" if device == "cuda" else "int8" # 'auto' / 'fp16': FP16 on GPU, dynamic INT8 on CPU
+
+@lru_cache(maxsize=2)
+def _get_model(model_name, device, compute_type, backend):
+    import_asr_modules()
+    if backend == "faster-whisper":
+        # One CTranslate2 worker per ASR pool thread so pooled jobs sharing this cached model really decode in parallel;
+        # the cores are split between them rather than each worker taking half the machine
+        workers = asr_worker_count()
+        return WhisperModel(model_name, device=device, compute_type=compute_type,
+                            cpu_threads=max(1, (os.cpu_count() or 2) // workers), num_workers=workers)
+    model = whisper.load_model(model_name, device=device)
+    if compute_type == "int8" and device == "cpu":
+        # quantize_dynamic only swaps exact nn.Linear types; whisper's Linear subclass just adds a dtype cast
+        for module in model.modules():
+            if isinstance(module, torch.nn.Linear): module.__class__ = torch.nn.Linear
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
+
+def _warm_up_model(model, backend, compute_type):
+    """Runs one throwaway decode of 30 s of silence (no VAD, which would skip it) to prime kernels and workspaces."""
+    silence = np.zeros(30 * 16000, dtype=np.float32)
+    start = time.time()
+    try:
+        if backend == "faster-whisper":
+            segments, _ = model.transcribe(silence, language="en"); list(segments)
+        else:
+            with _OPENAI_INFERENCE_LOCK: model.transcribe(silence, language="en", verbose=None, fp16=compute_type in ("float16", "int8_float16"))
+        logger_app.info(f"Model warm-up finished in {time.time() - start:.1f}s.")
+    except Exception as e: logger_app.warning(f"Model warm-up failed (continuing without it): {e}")
+
+def load_whisper_model(model_name, device, backend=DEFAULT_WHISPER_BACKEND, compute_type=None, on_warmup=None):
+    """
+    Returns a Whisper model on the given backend (faster-whisper/CTranslate2, or openai-whisper).
+    Models are cached per (model_name, device, compute_type, backend); the two most recent stay loaded,
+    so repeated runs and monitor-triggered files skip the disk read and GPU upload.
+    Fresh loads are warmed up once when WARMUP_ON_LOAD is set; on_warmup() is called just before.
+    """
+    compute_type = compute_type or resolve_compute_type("auto", device)
+    with _MODEL_CACHE_LOCK:
+        misses_before = _get_model.cache_info().misses
+        model = _get_model(model_name, device, compute_type, backend)
+        if _get_model.cache_info().misses != misses_before:
+            logger_app.info(f"Loaded Whisper weights for '{model_name}' ({backend}, {device}, {compute_type}).")
+            if WARMUP_ON_LOAD:
+                if on_warmup: on_warmup()
+                with gpu_slot(device): _warm_up_model(model, backend, compute_type)
+        else:
+            logger_app.info(f"Reusing cached Whisper model '{model_name}' ({backend}, {device}, {compute_type}).")
+    return model
+
+def release_whisper_models():
+    """Drops the cached models and returns freed CUDA memory to the driver (jobs still running keep their own reference)."""
+    with _MODEL_CACHE_LOCK:
+        if _get_model.cache_info().currsize == 0: return
+        _get_model.cache_clear()
+    if torch is not None and torch.cuda.is_available(): torch.cuda.empty_cache()
+    logger_app.info("Released cached Whisper models.")
+
+def transcribe_audio(model, audio, backend=DEFAULT_WHISPER_BACKEND, compute_type="float32", should_stop=None, decoding=DEFAULT_DECODING):
+    """
+    Transcribes an audio file path or an extract_pcm() array with a model from load_whisper_model().
+    Returns an openai-whisper style result dict ('text', 'segments') regardless of backend.
+    faster-whisper decodes lazily while its segments are consumed, so should_stop() is checked per segment
+    and ends decoding early (the result then holds the segments decoded so far).
+    decoding="fast" skips silence (Silero VAD on faster-whisper) and decodes greedily instead of with a beam.
+    """
+    fast = decoding == "fast"
+    if backend == "faster-whisper":
+        segments, info = model.transcribe(audio, beam_size=1 if fast else 5, vad_filter=True,
+                                          vad_parameters=dict(min_silence_duration_ms=500) if fast else None)
+        seg_dicts = []
+        for seg in segments:
+            seg_dicts.append({"start": seg.start, "end": seg.end, "text": seg.text})
+            if should_stop and should_stop(): logger_app.warning(f"Transcription stopped after {len(seg_dicts)} segments."); break
+        return {"text": "".join(seg["text"] for seg in seg_dicts), "segments": seg_dicts, "language": info.language}
+    fast_options = dict(no_speech_threshold=0.6, condition_on_previous_text=False, beam_size=1, best_of=1, temperature=0.0) if fast else {}
+    with _OPENAI_INFERENCE_LOCK:
+        return model.transcribe(audio, verbose=True, fp16=compute_type in ("float16", "int8_float16"), **fast_options)
+
+_ASR_EXECUTOR = None
+_ASR_EXECUTOR_LOCK = threading.Lock()
+_GPU_SEMAPHORE = threading.Semaphore(1) # One transcription on the GPU at a time; audio extraction and CPU decodes overlap it
+
+def asr_worker_count():
+    # On GPU, two jobs: one decodes its audio on the CPU while the other holds the GPU slot
+    return 2 if cuda_available() else max(1, (os.cpu_count() or 4) // 4)
+
+def get_asr_executor():
+    """Returns the pool shared by all folder monitors for their transcriptions (created on first use)."""
+    global _ASR_EXECUTOR
+    with _ASR_EXECUTOR_LOCK:
+        if _ASR_EXECUTOR is None:
+            _ASR_EXECUTOR = ThreadPoolExecutor(max_workers=asr_worker_count(), thread_name_prefix="WhisperCreepASR")
+            logger_app.info(f"Transcription pool started with {_ASR_EXECUTOR._max_workers} worker(s).")
+        return _ASR_EXECUTOR
+
+_EXTRACT_EXECUTOR = None
+
+def extract_pcm_async(media_path):
+    """Starts extract_pcm on a shared background thread and returns its Future, so decoding can overlap a model load."""
+    global _EXTRACT_EXECUTOR
+    with _ASR_EXECUTOR_LOCK:
+        if _EXTRACT_EXECUTOR is None: _EXTRACT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="WhisperCreepExtract")
+    return _EXTRACT_EXECUTOR.submit(extract_pcm, media_path)
+
+def gpu_slot(device):
+    """Context manager that serializes GPU transcriptions across the GUI worker and monitor pool."""
+    return _GPU_SEMAPHORE if device == "cuda" else contextlib.nullcontext()
+
+_NETWORK_MAP: dict[str, str] | None = None # Drive letter -> UNC for connected network drives; built on first use, rebuilt on WM_DEVICECHANGE
+WM_DEVICECHANGE = 0x0219
+
+def refresh_network_map():
+    """Snapshots the connected network drive mappings in one enumeration instead of a lookup RPC per check."""
+    global _NETWORK_MAP
+    mapping = {}
+    try:
+        import win32wnet, win32netcon
+        handle = win32wnet.WNetOpenEnum(win32netcon.RESOURCE_CONNECTED, win32netcon.RESOURCETYPE_DISK, 0, None)
+        try:
+            while True:
+                resources = win32wnet.WNetEnumResource(handle, 0)
+                if not resources: break
+                for res in resources:
+                    if res.lpLocalName: mapping[res.lpLocalName[0].upper()] = res.lpRemoteName
+        finally: win32wnet.WNetCloseEnum(handle)
+    except Exception as e: logger_app.warning(f"Could not enumerate network drives: {e}")
+    _NETWORK_MAP = mapping
+    logger_app.debug("Network drive map refreshed: %s", mapping)
+    return mapping
+
+_PATH_CHECK_TTL = 60 # Seconds a passed path check stays valid
+_path_check_cache: dict[tuple, tuple[float, bool]] = {} # (check, path, parent mtime) -> (checked at, result)
+
+def cached_path_check(kind, path, check):
+    """Runs check(path), reusing a passed result for the same path and parent mtime for _PATH_CHECK_TTL seconds."""
+    try: parent_mtime = os.stat(os.path.dirname(os.path.normpath(path)) or path).st_mtime
+    except OSError: parent_mtime = None
+    key = (kind, path, parent_mtime); cached = _path_check_cache.get(key)
+    if cached and time.time() - cached[0] < _PATH_CHECK_TTL: return cached[1]
+    result = check(path)
+    if result: _path_check_cache[key] = (time.time(), True) # Failures aren't cached so a fixed share is seen on the next try
+    else: _path_check_cache.pop(key, None)
+    return result
+
+AUDIO_SAMPLE_RATE = 16000 # Whisper's input rate
+
+def extract_pcm(media_path):
+    """
+    Decodes a media file's audio in-process with PyAV (libavformat) into 16 kHz mono float32 (no temp WAV, no ffmpeg process).
+    Returns (pcm, error); pcm is None if decoding failed, and is empty if the file has no audio stream.
+    """
+    try:
+        import av
+        chunks = []
+        with av.open(media_path) as container:
+            stream = next((s for s in container.streams if s.type == 'audio'), None)
+            if stream is None: return np.zeros(0, dtype=np.float32), ""
+            stream.thread_type = "AUTO" # Let the decoder use frame/slice threads across all cores
+            ctx = stream.codec_context
+            if ctx.sample_rate == AUDIO_SAMPLE_RATE and ctx.channels == 1 and ctx.format is not None and ctx.format.name in ("flt", "fltp"):
+                # Already 16 kHz mono float (common for screen captures): take decoded frames as-is, no resample pass
+                for frame in container.decode(stream): chunks.append(frame.to_ndarray().reshape(-1))
+            else:
+                # Resample straight to packed float32 so no int16 buffer or /32768 pass is needed afterwards
+                resampler = av.AudioResampler(format="flt", layout="mono", rate=AUDIO_SAMPLE_RATE)
+                for frame in container.decode(stream):
+                    chunks.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(frame))
+                chunks.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(None)) # Flush buffered samples
+        return (np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)), ""
+    except Exception as e: return None, str(e)
+
+def _model_size_rank(model_name):
+    """Relative size of a Whisper model name (e.g. "tiny.en" ranks as "tiny"); unknown names rank largest."""
+    return _MODEL_SIZE_RANK.get(model_name.split(".")[0].split("-")[0], len(_MODEL_SIZE_RANK))
+
+def probe_duration(media_path):
+    """Container duration in seconds from the file header alone (no decode), or None if it can't be read."""
+    try:
+        import av
+        with av.open(media_path) as container:
+            return container.duration / av.time_base if container.duration else None
+    except Exception: return None
+
+def collect_pcm(pcm_future, media_path, log=logger_app):
+    """Waits for an extract_pcm_async() result. Returns (pcm, error); pcm is None with a short user-facing error on failure or no audio."""
+    pcm, extract_err = pcm_future.result()
+    if pcm is None: log.error(f"Audio extraction error: {extract_err}"); return None, f"Audio extract error: {extract_err[:150]}..."
+    if pcm.size == 0: log.error(f"Audio decode OK but produced no audio for '{media_path}'"); return None, "No audio data in file."
+    log.info(f"Audio extraction OK ({pcm.size / AUDIO_SAMPLE_RATE:.1f}s)."); return pcm, ""
+
+def run_transcription(model, audio, device, backend=DEFAULT_WHISPER_BACKEND, compute_type="float32", should_stop=None, decoding=DEFAULT_DECODING):
+    """Shared monitor/GUI transcription step: transcribe_audio() holding the GPU slot for the whole pass."""
+    with gpu_slot(device): return transcribe_audio(model, audio, backend, compute_type, should_stop=should_stop, decoding=decoding)
+
+def write_transcript(dest_path, res_dict, header="", empty_text="", durable=False):
+    """
+    Writes header plus the formatted segments (or Whisper's plain text if there are none) to dest_path as one encoded payload.
+    Writes empty_text instead when there is no text at all; durable=True fsyncs before returning (for a following os.replace).
+    Returns whether any transcript text was written.
+    """
+    segments = res_dict.get("segments")
+    body = format_transcript(segments) if segments else ""
+    if not body:
+        full_txt = res_dict.get("text", "").strip()
+        body = full_txt + "\n" if full_txt else ""
+    text = header + (body or empty_text)
+    if os.linesep != "\n": text = text.replace("\n", os.linesep) # Keep the platform newlines text mode used to write
+    payload = memoryview(text.encode("utf-8"))
+    fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while payload: payload = payload[os.write(fd, payload):] # Normally a single write; loops only on a short write
+        if durable: os.fsync(fd)
+    finally: os.close(fd)
+    return bool(body)
+
+APP_QICON = None # Shared application icon, decoded once by app_icon() and rebound when the user picks a new one
+
+def app_icon():
+    """Returns the application QIcon (custom icon from settings, else WhisperCreepICO.ico, else a theme icon), loading it on first call."""
+    global APP_QICON
+    if APP_QICON is None:
+        icon_name = _SETTINGS.value("ui/icon_path", "", str)
+        if not icon_name: # Icon copied in before it was stored in settings: probe once, then remember it so later starts skip the stats
+            icon_name = next((name for name in ("custom_app_icon.ico", "custom_app_icon.png") if os.path.exists(os.path.join(SCRIPT_DIR, name))), "")
+            if icon_name: _SETTINGS.setValue("ui/icon_path", icon_name)
+        candidates = ([("custom", os.path.join(SCRIPT_DIR, icon_name))] if icon_name else []) + [("default", DEFAULT_ICON_PATH)]
+        for kind, icon_path in candidates:
+            logger_app.info(f"Attempting to load {kind} icon from: {icon_path}")
+            icon = QIcon(icon_path) # No separate exists() stat: a missing/unreadable file gives a null icon or no sizes
+            if icon.isNull() or not icon.availableSizes(): logger_app.warning(f"Icon missing or unreadable at: {icon_path}"); continue
+            logger_app.info(f"Successfully loaded {kind} icon from: {icon_path}"); APP_QICON = icon; break
+        else:
+            APP_QICON = QIcon.fromTheme("system-run", QIcon.fromTheme("applications-system"))
+            logger_app.info("Using system default icon")
+    return APP_QICON
+
 def get_download_folder_path():
     """
     Determines user's Downloads folder path with increased robustness.
@@ -115,14 +440,14 @@ def get_download_folder_path():
 
     # Strategy 1: USERPROFILE environment variable (primarily for Windows)
     user_profile_env = os.environ.get('USERPROFILE')
-    logger_app.debug(f"Value of os.environ.get('USERPROFILE'): '{user_profile_env}'")
+    logger_app.debug("Value of os.environ.get('USERPROFILE'): '%s'", user_profile_env)
 
     if user_profile_env and user_profile_env.strip(): # Check if not None and not empty/whitespace
         # Ensure user_profile_env itself is an absolute and valid directory
         abs_user_profile = os.path.abspath(user_profile_env)
         if os.path.isdir(abs_user_profile):
             candidate_path = os.path.join(abs_user_profile, 'Downloads')
-            logger_app.debug(f"Using USERPROFILE strategy. Candidate Downloads path: '{candidate_path}'")
+            logger_app.debug("Using USERPROFILE strategy. Candidate Downloads path: '%s'", candidate_path)
             # os.path.abspath will ensure it's truly absolute, even if candidate_path was somehow relative
             final_downloads_path = os.path.abspath(candidate_path)
         else:
@@ -133,10 +458,10 @@ def get_download_folder_path():
     # Strategy 2: Home directory (cross-platform fallback)
     if not final_downloads_path: 
         home_dir = os.path.expanduser('~') # This should always return an absolute path
-        logger_app.debug(f"Value of os.path.expanduser('~'): '{home_dir}'")
+        logger_app.debug("Value of os.path.expanduser('~'): '%s'", home_dir)
         if home_dir and os.path.isdir(home_dir): # Check if home_dir is valid
             candidate_path = os.path.join(home_dir, 'Downloads')
-            logger_app.debug(f"Using home directory strategy. Candidate Downloads path: '{candidate_path}'")
+            logger_app.debug("Using home directory strategy. Candidate Downloads path: '%s'", candidate_path)
             final_downloads_path = os.path.abspath(candidate_path) # Ensure absolute
         else:
             logger_app.critical(f"CRITICAL: Could not determine a valid base for Downloads. USERPROFILE strategy failed, and home directory ('{home_dir}') is invalid or not found.")
@@ -158,7 +483,7 @@ def get_download_folder_path():
             logger_app.error(f"CRITICAL: Path '{final_downloads_path}' exists but is NOT a directory. Cannot use as Downloads folder.")
             return None
         else: # Path exists and is a directory
-            logger_app.debug(f"Downloads directory '{final_downloads_path}' already exists and is a directory.")
+            logger_app.debug("Downloads directory '%s' already exists and is a directory.", final_downloads_path)
         
         return final_downloads_path
     except Exception as e:
@@ -181,18 +506,79 @@ class ProcessingIndicatorDialog(QDialog):
         self.kill_button_dialog.clicked.connect(self._request_kill)
         main_layout.addWidget(self.kill_button_dialog)
         self.spinner_chars = ["📀", "💿", "🎬", "🎵"] 
-        self.char_index = 0; self.timer = QTimer(self); self.timer.timeout.connect(self._update_spinner)
+        self.char_index = 0; self.status_text = "Processing..."; self.timer = QTimer(self); self.timer.timeout.connect(self._update_spinner)
         self.setFixedSize(280, 150); logger_app.debug("ProcessingIndicatorDialog initialized.")
-    def _update_spinner(self): self.char_index=(self.char_index+1)%len(self.spinner_chars); self.spinner_label.setText(f"{self.spinner_chars[self.char_index]} Processing...")
+    def _update_spinner(self): self.char_index=(self.char_index+1)%len(self.spinner_chars); self.spinner_label.setText(f"{self.spinner_chars[self.char_index]} {self.status_text}")
+    def set_status(self, text): self.status_text = text; self.spinner_label.setText(f"{self.spinner_chars[self.char_index]} {text}")
     def _request_kill(self): logger_app.info("Kill Process on Dialog clicked."); self.kill_process_requested.emit() 
     def start_animation(self): logger_app.info("ProcessingIndicatorDialog animation started."); self.char_index=0; self.spinner_label.setText(f"{self.spinner_chars[self.char_index]} Processing..."); self.timer.start(300); self.show()
     def stop_animation_and_close(self): logger_app.info("ProcessingIndicatorDialog stop_animation_and_close called."); self.timer.stop(); self.close() 
     def closeEvent(self, event): logger_app.debug("ProcessingIndicatorDialog closeEvent."); self.timer.stop(); super().closeEvent(event)
 
+# --- Folder Watcher Event Handler ---
+def video_file_event_handler(file_queue):
+    """Returns a watchdog handler queuing video files that appear in (or are moved into) the monitored folder; watchdog loads on first call."""
+    if "VideoFileEventHandler" not in _LAZY:
+        class VideoFileEventHandler(lazy_attr("watchdog.events", "PatternMatchingEventHandler")):
+            def __init__(self, file_queue):
+                super().__init__(patterns=[f"*{ext}" for ext in VIDEO_EXTENSIONS], ignore_directories=True, case_sensitive=False)
+                self.file_queue = file_queue
+            def on_created(self, event): self.file_queue.put(os.path.basename(event.src_path))
+            def on_closed(self, event): self.file_queue.put(os.path.basename(event.src_path)) # inotify only; copy finished
+            def on_moved(self, event): self.file_queue.put(os.path.basename(event.dest_path))
+        _LAZY["VideoFileEventHandler"] = VideoFileEventHandler
+    return _LAZY["VideoFileEventHandler"](file_queue)
+
+# --- Processed-File Store ---
+class ProcessedFileStore:
+    """Set-like record of transcribed files kept in sqlite, so a restarted monitor doesn't redo them. Use from one thread."""
+    def __init__(self, db_path):
+        self._db = sqlite3.connect(db_path, timeout=10) # Other monitors may hold the write lock briefly
+        self._db.execute("CREATE TABLE IF NOT EXISTS done(key TEXT PRIMARY KEY)"); self._db.commit()
+    def __contains__(self, key): return key is not None and self._db.execute("SELECT 1 FROM done WHERE key=?", (key,)).fetchone() is not None
+    def add(self, key): self._db.execute("INSERT OR IGNORE INTO done(key) VALUES (?)", (key,)); self._db.commit()
+    def close(self): self._db.close()
+
+# --- Start-Monitoring Path Checks ---
+class PathCheckWorker(QObject):
+    """Runs the monitor's network/permission probes off the GUI thread; emits ("", "") when all pass."""
+    finished = Signal(str, str) # (error title, error message)
+    def __init__(self, dialog, folder, output):
+        super().__init__(); self.dialog = dialog; self.folder = folder; self.output = output
+    def run(self):
+        checks = [
+            (self.dialog.check_network_path, self.folder, "Network Error", "Cannot access the selected folder. It may be a network path that is unavailable or inaccessible."),
+            (self.dialog.check_network_path, self.output, "Network Error", "Cannot access the output location. It may be a network path that is unavailable or inaccessible."),
+            (self.dialog.check_folder_permissions, self.folder, "Permission Error", "Cannot access the selected folder. Please check your permissions."),
+            (self.dialog.check_folder_permissions, self.output, "Permission Error", "Cannot access the output location. Please check your permissions."),
+        ]
+        for check, path, title, message in checks:
+            if not check(path): self.finished.emit(title, message); return
+        self.finished.emit("", "")
+
+# --- Folder Monitor Worker ---
+class MonitorWorker(QObject):
+    """Runs a MonitorFolderDialog's monitor loop on a QThread; the loop reports UI changes through the dialog's signals."""
+    finished = Signal()
+    def __init__(self, dialog):
+        super().__init__(); self.dialog = dialog
+    def run(self):
+        try: self.dialog.monitor_folder()
+        finally:
+            self.finished.emit()
+            # Quit from this thread: a queued quit() would never reach a GUI thread blocked in wait()
+            self.thread().quit()
+
 # --- Monitor Folder Dialog (move this above WhisperCreepInterface) ---
 class MonitorFolderDialog(QDialog):
     _instances = set()  # Track all instances
-    _retry_pause_active = False  # Track if any monitor is in retry pause
+    tooltip_changed = Signal(str)  # Emitted from monitor/pool threads; queued to the tray icon on the GUI thread
+    stop_requested = Signal()  # Monitor thread asks the GUI thread to stop monitoring
+
+    @classmethod
+    def active_monitors(cls):
+        """Open dialogs that are currently monitoring (a direct registry, no top-level widget scan)."""
+        return [dialog for dialog in cls._instances if dialog.monitoring]
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -231,7 +617,7 @@ class MonitorFolderDialog(QDialog):
                 background-color: #222222;
                 color: #888888;
             }
-            QLineEdit {
+            QLineEdit, QComboBox {
                 background-color: #222222;
                 color: white;
                 border: 1px solid #444444;
@@ -269,6 +655,19 @@ class MonitorFolderDialog(QDialog):
         layout.addWidget(self.time_label)
         layout.addWidget(self.time_input)
 
+        # Short-clip model routing (advanced)
+        self.short_clip_label = QLabel("Short-clip threshold (seconds, 0 = off):")
+        self.short_clip_input = QLineEdit(str(SHORT_CLIP_SECONDS))
+        self.short_clip_input.setValidator(QIntValidator(0, 3600))
+        self.short_model_label = QLabel("Model for short clips:")
+        self.short_model_combo = QComboBox()
+        self.short_model_combo.addItems(SHORT_CLIP_MODELS)
+        self.short_model_combo.setCurrentText(DEFAULT_SHORT_CLIP_MODEL)
+        layout.addWidget(self.short_clip_label)
+        layout.addWidget(self.short_clip_input)
+        layout.addWidget(self.short_model_label)
+        layout.addWidget(self.short_model_combo)
+
         # Button layout for Apply, Save, and Close
         btn_layout = QHBoxLayout()
         self.apply_button = QPushButton("Apply Settings")
@@ -302,42 +701,42 @@ class MonitorFolderDialog(QDialog):
 
         self.monitoring = False
         self.monitor_thread = None
+        self.monitor_worker = None
+        self.path_check_thread = None
+        self.path_check_worker = None
         self.stop_event = threading.Event()
-        self.processed_files = set()
+        self.file_queue = None  # Watcher/job-done queue of the running monitor loop; None wakes it (see _request_monitor_stop)
+        self.processed_files = None  # ProcessedFileStore, opened on the monitor thread while monitoring
         self.staged_settings = {}
         self.settings = None  # Will be set when settings are saved
+        self.model_policy = {"short": DEFAULT_SHORT_CLIP_MODEL, "long": "base"}  # Model per clip length; "short" is set from the settings
+        self.short_clip_seconds = SHORT_CLIP_SECONDS
         self.tray_icon = None
         self.setup_tray_icon()
-        self.log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "monitor_system.log")
-        self.last_file_size = None
-        self.size_check_time = None
-        self.temp_output_path = None
+        self.tooltip_changed.connect(self.tray_icon.setToolTip)
+        self.stop_requested.connect(self.stop_monitoring)
+        self.log_path = os.path.join(SCRIPT_DIR, "monitor_system.log")
+        self.processed_db_path = os.path.join(os.path.dirname(self.log_path), "processed.db")
+        self._setup_event_log()
+        self.size_checks = {}  # file path -> (last size, time of last size change), for verify_file_consistency
+        self.temp_output_paths = set()  # .partial transcripts of in-flight jobs, removed on close
         
         # Keep a reference to the parent window
         self.parent_window = parent
+        self.restore_saved_settings()
+
+    def restore_saved_settings(self):
+        """Pre-fills the form with the last saved monitor settings (Apply/Save still confirm them)."""
+        folder = _SETTINGS.value("monitor/folder", "", str); output = _SETTINGS.value("monitor/output", "", str)
+        if folder: self.folder_path = folder; self.folder_path_label.setText(folder)
+        if output: self.output_path = output; self.output_path_label.setText(output)
+        self.time_input.setText(_SETTINGS.value("monitor/interval", "", str))
+        self.short_clip_input.setText(_SETTINGS.value("monitor/short_clip_seconds", str(SHORT_CLIP_SECONDS), str))
+        self.short_model_combo.setCurrentText(_SETTINGS.value("monitor/short_clip_model", DEFAULT_SHORT_CLIP_MODEL, str))
 
     def setup_tray_icon(self):
         self.tray_icon = QSystemTrayIcon(self)
-        # Try to load the custom icon
-        try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            icon_path = os.path.join(script_dir, "WhisperCreepICO.ico")
-            logger_app.info(f"Attempting to load icon from: {icon_path}")
-            
-            if os.path.exists(icon_path):
-                icon = QIcon(icon_path)
-                if not icon.isNull():
-                    self.tray_icon.setIcon(icon)
-                    logger_app.info(f"Successfully loaded custom icon from: {icon_path}")
-                else:
-                    raise Exception("Icon loaded but is null")
-            else:
-                raise FileNotFoundError(f"Icon file not found at: {icon_path}")
-        except Exception as e:
-            logger_app.error(f"Error loading custom icon: {e}")
-            self.tray_icon.setIcon(QIcon.fromTheme("system-run", QIcon.fromTheme("applications-system")))
-            logger_app.info("Using system default icon")
-        
+        self.tray_icon.setIcon(app_icon())
         self.tray_icon.setToolTip("WhisperCreep Folder Monitor")
         menu = QMenu()
         restore_action = QAction("Restore Monitor", self)
@@ -383,7 +782,9 @@ class MonitorFolderDialog(QDialog):
         self.staged_settings = {
             'folder': self.folder_path,
             'output': self.output_path,
-            'interval': self.time_input.text()
+            'interval': self.time_input.text(),
+            'short_clip_seconds': self.short_clip_input.text() or "0",
+            'short_clip_model': self.short_model_combo.currentText()
         }
         QMessageBox.information(self, "Settings Staged", "Settings have been staged but not saved. Click 'Save Settings' to apply them permanently.")
 
@@ -393,41 +794,50 @@ class MonitorFolderDialog(QDialog):
             return
             
         self.settings = self.staged_settings.copy()
+        self.model_policy["short"] = self.settings['short_clip_model']
+        self.short_clip_seconds = int(self.settings['short_clip_seconds'])
+        for key, value in self.settings.items(): _SETTINGS.setValue(f"monitor/{key}", value)
         self.start_button.setEnabled(True)  # Enable start button when settings are saved
         QMessageBox.information(self, "Settings Saved", "Your monitoring settings have been saved. You can now start monitoring.")
 
     def check_network_path(self, path):
-        """Check if a path is a network path and verify its accessibility."""
+        """Check if a path is a network path and verify its accessibility (passed results cached briefly)."""
+        return cached_path_check("network", path, self._check_network_path)
+
+    def _check_network_path(self, path):
         try:
-            # Check if it's a UNC path or mapped drive
-            if path.startswith('\\\\') or (len(path) > 2 and path[1:3] == ':\\' and win32file.WNetGetConnection(path[0] + ':')):
-                # Try to get network path info
-                try:
-                    win32file.WNetGetResourceInformation(path)
-                except Exception as e:
-                    logger_app.error(f"Network path validation failed: {e}")
-                    return False
-                
-                # Test write access with a small file
-                test_file = os.path.join(path, f'.wc_test_{int(time.time())}.tmp')
-                try:
-                    with open(test_file, 'w') as f:
-                        f.write('test')
-                    os.remove(test_file)
-                except Exception as e:
-                    logger_app.error(f"Network path write test failed: {e}")
-                    return False
+            import win32file, win32con
+            # Local paths (non-drive-letter, or fixed drives) need no network checks
+            if not path.startswith('\\\\'):
+                if len(path) < 3 or path[1:3] != ':\\' or win32file.GetDriveType(path[:3]) == win32con.DRIVE_FIXED:
+                    return True
+                if path[0].upper() not in (_NETWORK_MAP if _NETWORK_MAP is not None else refresh_network_map()):  # Mapped drives come from the cached snapshot
+                    return True
+            # Test write access with a small file
+            test_file = os.path.join(path, f'.wc_test_{int(time.time())}.tmp')
+            try:
+                with open(test_file, 'w') as f:
+                    f.write('test')
+                os.remove(test_file)
+            except Exception as e:
+                logger_app.error(f"Network path write test failed: {e}")
+                return False
             return True
         except Exception as e:
             logger_app.error(f"Network path check failed: {e}")
             return False
 
     def check_folder_permissions(self, path):
-        """Check if we have read/write permissions for a folder."""
+        """Check if we have read/write permissions for a folder (passed results cached briefly)."""
+        return cached_path_check("permissions", path, self._check_folder_permissions)
+
+    def _check_folder_permissions(self, path):
         try:
             # Test read access
             os.listdir(path)
-            # Test write access
+            # Cheap write probe first; os.access is unreliable on NT, so fall back to a real test write
+            if os.access(path, os.W_OK):
+                return True
             test_file = os.path.join(path, f'.wc_perm_test_{int(time.time())}.tmp')
             with open(test_file, 'w') as f:
                 f.write('test')
@@ -437,29 +847,41 @@ class MonitorFolderDialog(QDialog):
             logger_app.error(f"Permission check failed for {path}: {e}")
             return False
 
+    def _verify_transfer_permissions(self, file_path, export_path, check):
+        """Checks read access to the source folder and write access to the output folder with check(); logs which was lost."""
+        if not check(os.path.dirname(file_path)):
+            logger_app.error(f"Lost read permission for {file_path}")
+            self.log_event(f"Lost read permission: {os.path.basename(file_path)}")
+            return False
+        if not check(os.path.dirname(export_path)):
+            logger_app.error(f"Lost write permission for {export_path}")
+            self.log_event(f"Lost write permission: {os.path.basename(export_path)}")
+            return False
+        return True
+
     def verify_file_consistency(self, file_path, check_interval=2, num_checks=3):
         """Check if file size remains consistent over multiple checks."""
         try:
-            current_size = os.path.getsize(file_path)
-            if self.last_file_size is None:
-                self.last_file_size = current_size
-                self.size_check_time = time.time()
+            # Always dwell: copy tools keep the source mtime and NTFS updates it lazily, so mtime can't prove a copy is done
+            current_size = os.stat(file_path, follow_symlinks=False).st_size
+            last_check = self.size_checks.get(file_path)
+            if last_check is None:
+                self.size_checks[file_path] = (current_size, time.time())
                 return False
             
-            if time.time() - self.size_check_time < check_interval:
+            last_size, size_check_time = last_check
+            if time.time() - size_check_time < check_interval:
                 return False
                 
-            if current_size != self.last_file_size:
-                self.last_file_size = current_size
-                self.size_check_time = time.time()
+            if current_size != last_size:
+                self.size_checks[file_path] = (current_size, time.time())
                 return False
                 
             # Size remained consistent
-            self.last_file_size = None
-            self.size_check_time = None
+            del self.size_checks[file_path]
             return True
         except Exception as e:
-            logger_app.error(f"File consistency check failed: {e}")
+            logger_app.error("File consistency check failed: %s", e)
             return False
 
     def start_monitoring(self):
@@ -471,38 +893,38 @@ class MonitorFolderDialog(QDialog):
             QMessageBox.warning(self, "Input Error", "Please fill all fields and save settings.")
             return
 
-        # Check network paths
-        if not self.check_network_path(self.settings['folder']):
-            QMessageBox.critical(self, "Network Error", 
-                "Cannot access the selected folder. It may be a network path that is unavailable or inaccessible.")
-            return
-            
-        if not self.check_network_path(self.settings['output']):
-            QMessageBox.critical(self, "Network Error", 
-                "Cannot access the output location. It may be a network path that is unavailable or inaccessible.")
+        if self.path_check_thread is not None:
+            return  # Checks from a previous click are still running
+        self._wait_for_monitor_thread()
+        if self.monitor_thread is not None:
+            # The old loop still shares stop_event/processed_files; never clear the event or start a second loop under it
+            QMessageBox.warning(self, "Still Stopping", "The previous monitoring run is still shutting down. Please try again in a moment.")
             return
 
-        # Check permissions
-        if not self.check_folder_permissions(self.settings['folder']):
-            QMessageBox.critical(self, "Permission Error", 
-                "Cannot access the selected folder. Please check your permissions.")
-            return
-            
-        if not self.check_folder_permissions(self.settings['output']):
-            QMessageBox.critical(self, "Permission Error", 
-                "Cannot access the output location. Please check your permissions.")
+        # Network and permission probes can stall on a slow share, so run them off the GUI thread
+        self.start_button.setEnabled(False)
+        self.start_button.setText("Checking Folders...")
+        self.path_check_thread = QThread(self)
+        self.path_check_worker = PathCheckWorker(self, self.settings['folder'], self.settings['output'])
+        self.path_check_worker.moveToThread(self.path_check_thread)
+        self.path_check_thread.started.connect(self.path_check_worker.run)
+        self.path_check_worker.finished.connect(self._on_path_checks_finished)
+        self.path_check_worker.finished.connect(self.path_check_thread.quit)
+        self.path_check_thread.finished.connect(self.path_check_worker.deleteLater)
+        self.path_check_thread.finished.connect(self.path_check_thread.deleteLater)
+        self.path_check_thread.start()
+
+    def _on_path_checks_finished(self, error_title, error_message):
+        self.path_check_thread = None; self.path_check_worker = None
+        self.start_button.setText("Start Monitoring")
+        if error_title:
+            self.start_button.setEnabled(True)
+            QMessageBox.critical(self, error_title, error_message)
             return
 
-        # Register with state manager
+        # Register with state manager; monitors share one transcription pool, so several may run at once
         active_monitors = transcription_state.register_monitor(self.monitor_id)
         logger_app.info(f"Registered monitor {self.monitor_id}. Total active monitors: {active_monitors}")
-        
-        if active_monitors > 1:
-            QMessageBox.warning(self, "Multiple Monitors",
-                "Another monitoring session is already active.\n\n"
-                "Please stop the other session first.")
-            transcription_state.unregister_monitor(self.monitor_id)
-            return
             
         self.monitoring = True
         self.start_button.setEnabled(False)
@@ -515,7 +937,10 @@ class MonitorFolderDialog(QDialog):
         self.tray_icon.show()
         
         # Start monitoring thread
-        self.monitor_thread = threading.Thread(target=self.monitor_folder, daemon=True)
+        self.monitor_thread = QThread(self)
+        self.monitor_worker = MonitorWorker(self)
+        self.monitor_worker.moveToThread(self.monitor_thread)
+        self.monitor_thread.started.connect(self.monitor_worker.run)
         self.monitor_thread.start()
         
         # Hide window but don't close it
@@ -537,12 +962,8 @@ class MonitorFolderDialog(QDialog):
             return
             
         self.monitoring = False
-        self.stop_event.set()
-        
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=2)
-            if self.monitor_thread.is_alive():
-                logger_app.warning("Monitor thread did not stop gracefully")
+        self._request_monitor_stop()
+        self._wait_for_monitor_thread()
         
         # Unregister from state manager and log the count
         remaining = transcription_state.unregister_monitor(self.monitor_id)
@@ -559,6 +980,22 @@ class MonitorFolderDialog(QDialog):
         
         # Log the stop event
         self.log_event("MONITORING STOPPED")
+        self.event_log_handler.flush()
+
+    def _request_monitor_stop(self):
+        """Sets stop_event and wakes every wait of the monitor loop: a manual-run pause and the idle file_queue.get()."""
+        self.stop_event.set(); transcription_state.wake_waiters()
+        if self.file_queue is not None:
+            self.file_queue.put(None)
+
+    def _wait_for_monitor_thread(self):
+        if self.monitor_thread is None:
+            return
+        if not self.monitor_thread.wait(2000):
+            logger_app.warning("Monitor thread did not stop gracefully")
+            return  # Keep the references; the loop exits on its own once stop_event is seen
+        self.monitor_worker.deleteLater(); self.monitor_thread.deleteLater()
+        self.monitor_thread = None; self.monitor_worker = None
 
     def monitor_folder(self):
         try:
@@ -571,240 +1008,269 @@ class MonitorFolderDialog(QDialog):
             logger_app.info(f"Time increment: {time_increment} seconds")
             self.log_event(f"MONITORING ACTIVATED - Will check every {time_increment} seconds")
             
-            # Clear processed files list on start
-            self.processed_files = set()
-            
-            while not self.stop_event.is_set():
-                try:
-                    # Check if a transcription is in progress from the main app
-                    if transcription_state.is_transcribing:
-                        logger_app.info("Manual transcription in progress, pausing monitoring...")
-                        self.tray_icon.setToolTip("WhisperCreep Monitor - Monitoring On Hold")
-                        self.log_event("Monitoring paused due to manual transcription")
-                        # Wait until transcription is complete
-                        while transcription_state.is_transcribing and not self.stop_event.is_set():
-                            time.sleep(1)
-                        if not self.stop_event.is_set():
-                            logger_app.info("Manual transcription completed, waiting full interval before resuming...")
-                            self.tray_icon.setToolTip("WhisperCreep Monitor - Waiting to Resume")
-                            self.log_event("Manual transcription completed, waiting interval before resuming")
-                            # Wait the full interval before resuming
-                            for _ in range(time_increment):
-                                if self.stop_event.is_set():
-                                    break
-                                time.sleep(1)
+            # Files transcribed in earlier sessions stay recorded, so a restart doesn't redo them
+            self.processed_files = ProcessedFileStore(self.processed_db_path)
+
+            # Seed with the videos already in the folder; after that the watcher reports new ones
+            try:
+                with os.scandir(folder_to_monitor) as it:
+                    pending = [e.name for e in it
+                               if e.is_file(follow_symlinks=False) and e.name.rpartition('.')[2].lower() in VIDEO_EXTS]
+                logger_app.info(f"Found {len(pending)} video files already in {folder_to_monitor}")
+            except Exception as e:
+                logger_app.error(f"Error scanning folder {folder_to_monitor}: {e}")
+                self.log_event(f"ERROR scanning folder: {str(e)}")
+                pending = []
+
+            file_queue = self.file_queue = queue.Queue()
+            executor = get_asr_executor()
+            max_in_flight = asr_worker_count()
+            in_flight = {}  # file name -> (future, file path, export path, processed key)
+            retry_later = []  # Failed files, re-queued once the folder has been quiet for an interval
+            observer = self._start_folder_observer(folder_to_monitor, file_queue, time_increment)
+            try:
+                while not self.stop_event.is_set():
+                    try:
+                        # Check if a transcription is in progress from the main app
+                        if transcription_state.is_transcribing:
+                            logger_app.info("Manual transcription in progress, pausing monitoring...")
+                            self.tooltip_changed.emit("WhisperCreep Monitor - Monitoring On Hold")
+                            self.log_event("Monitoring paused due to manual transcription")
+                            # Wait until transcription is complete
+                            transcription_state.wait_until_idle(cancel=self.stop_event)
                             if not self.stop_event.is_set():
-                                logger_app.info("Resuming monitoring after interval...")
-                                self.tray_icon.setToolTip("WhisperCreep Monitor - Active")
-                                self.log_event("Monitoring resumed after waiting interval")
-                    
-                    # Verify folders still exist
-                    if not os.path.exists(folder_to_monitor):
-                        logger_app.error(f"Monitor folder does not exist: {folder_to_monitor}")
-                        self.log_event(f"ERROR: Monitor folder missing: {folder_to_monitor}")
-                        self.stop_monitoring()
-                        return
+                                logger_app.info("Manual transcription completed, waiting full interval before resuming...")
+                                self.tooltip_changed.emit("WhisperCreep Monitor - Waiting to Resume")
+                                self.log_event("Manual transcription completed, waiting interval before resuming")
+                                # Wait the full interval before resuming (returns early on stop)
+                                if not self.stop_event.wait(time_increment):
+                                    logger_app.info("Resuming monitoring after interval...")
+                                    self.tooltip_changed.emit("WhisperCreep Monitor - Active")
+                                    self.log_event("Monitoring resumed after waiting interval")
                         
-                    if not os.path.exists(output_location):
-                        logger_app.error(f"Output location does not exist: {output_location}")
-                        self.log_event(f"ERROR: Output folder missing: {output_location}")
-                        self.stop_monitoring()
-                        return
-                        
-                    # Scan for video files
-                    try:
-                        logger_app.info(f"Scanning for video files in {folder_to_monitor}")
-                        video_files = [f for f in os.listdir(folder_to_monitor) if f.lower().endswith((
-                            '.mp4', '.mov', '.avi', '.wmv', '.mkv'))]
-                        logger_app.info(f"Found {len(video_files)} video files, {len(self.processed_files)} already processed")
-                    except Exception as e:
-                        logger_app.error(f"Error scanning folder {folder_to_monitor}: {e}")
-                        self.log_event(f"ERROR scanning folder: {str(e)}")
-                        time.sleep(time_increment)
-                        continue
-                    
-                    unprocessed = [f for f in video_files if f not in self.processed_files]
-                    if unprocessed:
-                        logger_app.info(f"Found {len(unprocessed)} unprocessed videos: {', '.join(unprocessed)}")
-                    
-                    # Process only one file at a time
-                    if unprocessed:
-                        file_name = unprocessed[0]  # Take the first unprocessed file
-                        file_path = os.path.join(folder_to_monitor, file_name)
-                        if os.path.isfile(file_path):
-                            start_time = time.time()
-                            export_name = os.path.splitext(file_name)[0] + "_transcript.txt"
-                            export_path = os.path.join(output_location, export_name)
-                            
-                            self.log_event(f"START: {file_name}", src_path=file_path, dest_path=export_path)
-                            self.tray_icon.setToolTip(f"WhisperCreep Monitor - Transcribing: {file_name}")
-                            logger_app.info(f"Starting transcription process for {file_path} -> {export_path}")
-                            
-                            # Try to transcribe with retries
-                            transcription_result = self.transcribe_video(file_path, export_path)
-                            elapsed = time.time() - start_time
+                        # Verify folders still exist
+                        if not os.path.exists(folder_to_monitor):
+                            logger_app.error(f"Monitor folder does not exist: {folder_to_monitor}")
+                            self.log_event(f"ERROR: Monitor folder missing: {folder_to_monitor}")
+                            self.stop_requested.emit()
+                            return
                             
+                        if not os.path.exists(output_location):
+                            logger_app.error(f"Output location does not exist: {output_location}")
+                            self.log_event(f"ERROR: Output folder missing: {output_location}")
+                            self.stop_requested.emit()
+                            return
+
+                        # Pick up everything the watcher reported since the last pass (None = a job finished)
+                        while True:
+                            try:
+                                file_name = file_queue.get_nowait()
+                            except queue.Empty:
+                                break
+                            if file_name is not None and file_name not in pending and file_name not in in_flight:
+                                pending.append(file_name)
+
+                        # Collect finished transcriptions
+                        for file_name, (future, file_path, export_path, file_key) in list(in_flight.items()):
+                            if not future.done():
+                                continue
+                            del in_flight[file_name]
+                            export_name = os.path.basename(export_path)
+                            try:
+                                transcription_result, elapsed = future.result()
+                            except Exception as e:
+                                logger_app.error(f"Transcription job for {file_path} raised: {e}", exc_info=True)
+                                transcription_result, elapsed = False, 0.0
                             if transcription_result:
                                 self.log_event(f"DONE: {file_name} | Export: {export_name} | Time: {elapsed:.2f}s", src_path=file_path, dest_path=export_path)
                                 logger_app.info(f"Transcription SUCCESSFUL in {elapsed:.2f}s")
-                                self.processed_files.add(file_name)
+                                self.processed_files.add(file_key)
                             else:
                                 self.log_event(f"SKIPPED: {file_name} due to transcription failures", src_path=file_path)
                                 logger_app.warning(f"Transcription FAILED in {elapsed:.2f}s")
+                                retry_later.append(file_name)  # Retried after a quiet interval
+                        if pending and logger_app.isEnabledFor(logging.INFO):
+                            logger_app.info("%d pending videos: %s", len(pending), ', '.join(pending))
+                        
+                        # Hand pending files to the shared pool, keeping at most one job per pool worker
+                        while pending and len(in_flight) < max_in_flight:
+                            file_name = pending.pop(0)  # Take the first unprocessed file
+                            file_path = os.path.join(folder_to_monitor, file_name)
+                            file_key = self._processed_key(file_path)
+                            if file_key in self.processed_files:
+                                logger_app.debug("Skipping already processed file: %s", file_name)
+                                continue
+                            if file_key is None:
+                                logger_app.warning(f"File {file_path} not found or not a file")
+                                self.log_event(f"WARNING: File not found: {file_name}")
+                                continue  # Dropped from pending; the watcher reports it again if it reappears
+                            export_name = os.path.splitext(file_name)[0] + "_transcript.txt"
+                            export_path = os.path.join(output_location, export_name)
                             
-                            # Wait the full interval before processing next file
-                            logger_app.info(f"Waiting {time_increment} seconds before next file...")
-                            self.tray_icon.setToolTip(f"WhisperCreep Monitor - Waiting {time_increment}s before next file")
-                            for _ in range(time_increment):
-                                if self.stop_event.is_set():
-                                    break
-                                time.sleep(1)
+                            self.log_event(f"START: {file_name}", src_path=file_path, dest_path=export_path)
+                            logger_app.info("Starting transcription process for %s -> %s", file_path, export_path)
+                            future = executor.submit(self._timed_transcribe_video, file_path, export_path)
+                            future.add_done_callback(lambda _f: file_queue.put(None))  # Wake the loop to collect it
+                            in_flight[file_name] = (future, file_path, export_path, file_key)
+
+                        if in_flight:
+                            self.tooltip_changed.emit(f"WhisperCreep Monitor - Transcribing: {', '.join(in_flight)}")
                         else:
-                            logger_app.warning(f"File {file_path} not found or not a file")
-                            self.log_event(f"WARNING: File not found: {file_name}")
-                            self.processed_files.add(file_name)  # Mark as processed to avoid retrying
-                    else:
-                        # No new files, wait the interval before next scan
-                        self.tray_icon.setToolTip(f"WhisperCreep Monitor - No new files, checking in {time_increment}s")
-                        logger_app.info(f"No unprocessed files found. Checking again in {time_increment}s")
-                        for _ in range(time_increment):
-                            if self.stop_event.is_set():
-                                break
-                            time.sleep(1)
-                        
-                except Exception as e:
-                    logger_app.error(f"Error in monitoring loop: {e}", exc_info=True)
-                    self.log_event(f"ERROR in monitoring: {str(e)[:150]}")
-                    self.tray_icon.setToolTip(f"WhisperCreep Monitor - Error: {str(e)[:50]}...")
-                    time.sleep(time_increment)  # Wait before retrying
+                            self.tooltip_changed.emit("WhisperCreep Monitor - No new files, watching for changes")
+                            logger_app.info("No unprocessed files found. Waiting for folder changes (re-check every %ss)", time_increment)
+                        # Block until the watcher reports a file, a job finishes or stop is requested (re-checking state every interval)
+                        try:
+                            file_name = file_queue.get(timeout=time_increment)
+                            if file_name is not None and file_name not in pending and file_name not in in_flight:
+                                pending.append(file_name)
+                        except queue.Empty:
+                            pending.extend(f for f in retry_later if f not in pending)
+                            retry_later.clear()
+                            
+                    except Exception as e:
+                        logger_app.error(f"Error in monitoring loop: {e}", exc_info=True)
+                        self.log_event(f"ERROR in monitoring: {str(e)[:150]}")
+                        self.tooltip_changed.emit(f"WhisperCreep Monitor - Error: {str(e)[:50]}...")
+                        self.stop_event.wait(time_increment)  # Wait before retrying
+            finally:
+                observer.stop()
+                observer.join(timeout=2)
+                for future, *_ in in_flight.values():
+                    future.cancel()  # Jobs not yet started; running ones finish on their own
+                self.processed_files.close(); self.processed_files = None
+                self.file_queue = None
                     
         except Exception as e:
             logger_app.error(f"Fatal error in monitor_folder: {e}", exc_info=True)
             self.log_event(f"FATAL ERROR: {str(e)[:150]}")
-            self.stop_monitoring()
+            self.stop_requested.emit()
 
-    def check_file_lock(self, file_path, timeout=5):
-        """Check if a file is locked by attempting to open it with exclusive access."""
+    def _processed_key(self, file_path):
+        """Identity of a file for processed_files: "inode:size:mtime" (file ID on Windows), so a re-created file is processed again. None if missing."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return f"{st.st_ino}:{st.st_size}:{int(st.st_mtime)}"
+
+    def _start_folder_observer(self, folder, file_queue, poll_interval):
+        """Starts a kernel-notified watcher (ReadDirectoryChangesW/inotify) on folder, falling back to polling."""
+        handler = video_file_event_handler(file_queue)
+        observer = lazy_attr("watchdog.observers", "Observer")()
+        try:
+            observer.schedule(handler, folder, recursive=False)
+            observer.start()
+            logger_app.info(f"Watching {folder} for new video files ({type(observer).__name__})")
+        except Exception as e:
+            logger_app.warning(f"Native folder watcher unavailable for {folder}: {e}. Falling back to polling every {poll_interval}s.")
+            self.log_event(f"Native folder watcher unavailable, polling instead: {str(e)[:150]}")
+            observer = lazy_attr("watchdog.observers.polling", "PollingObserver")(timeout=poll_interval)
+            observer.schedule(handler, folder, recursive=False)
+            observer.start()
+        return observer
+
+    def _timed_transcribe_video(self, file_path, export_path):
+        """Pool job: transcribe_video() plus its wall time, for the DONE/SKIPPED log entries."""
         start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                # Try to open the file with exclusive access
-                with open(file_path, 'a'):
-                    return False  # File is not locked
-            except IOError:
-                # File is locked, wait a bit and try again
-                time.sleep(0.5)
-        return True  # File is locked after timeout
+        return self.transcribe_video(file_path, export_path), time.time() - start_time
+
+    def check_file_lock(self, file_path):
+        """Check once, without blocking, whether another process holds the file; callers retry with backoff."""
+        try:
+            with open(file_path, 'a') as f:  # Fails outright on Windows if a writer opened it without sharing
+                f.seek(0)
+                if os.name == 'nt':
+                    import msvcrt
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1); msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    import fcntl
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB); fcntl.flock(f, fcntl.LOCK_UN)
+            return False  # File is not locked
+        except OSError:
+            return True
+
+    def _model_for_duration(self, duration):
+        """model_policy entry for a clip of duration seconds: the "short" model below short_clip_seconds, if it's actually smaller."""
+        short, long = self.model_policy["short"], self.model_policy["long"]
+        if duration < self.short_clip_seconds and _model_size_rank(short) < _model_size_rank(long): return short
+        return long
 
     def transcribe_video(self, file_path, export_path, max_retries=2):
         retry_count = 0
-        import whisper
-        import torch
         import shutil
-        import tempfile
-        model_name = "base"  # You can make this configurable if desired
-        device = "cuda" if torch.cuda.is_available() else "cpu"
+        backend = DEFAULT_WHISPER_BACKEND
+        device = "cuda" if cuda_available() else "cpu"
+        compute_type = resolve_compute_type("auto", device)
         if device == "cpu":
             logger_app.warning("CUDA not available, falling back to CPU. This will be slower.")
         else:
             logger_app.info("CUDA is available, using GPU acceleration.")
+        # Permissions don't change between retries; check once here and again only if an attempt hits a PermissionError
+        if not self._verify_transfer_permissions(file_path, export_path, self.check_folder_permissions): return False
         while retry_count <= max_retries:
             try:
-                if MonitorFolderDialog._retry_pause_active:
-                    logger_app.info("Another process is in retry pause state, waiting...")
-                    time.sleep(2)
-                    continue
-
-                if not self.check_folder_permissions(os.path.dirname(file_path)):
-                    logger_app.error(f"Lost read permission for {file_path}")
-                    self.log_event(f"Lost read permission: {os.path.basename(file_path)}")
-                    return False
-
-                if not self.check_folder_permissions(os.path.dirname(export_path)):
-                    logger_app.error(f"Lost write permission for {export_path}")
-                    self.log_event(f"Lost write permission: {os.path.basename(export_path)}")
-                    return False
-
                 if os.path.exists(export_path) and self.check_file_lock(export_path):
                     logger_app.warning(f"Output file {export_path} is locked. Waiting for access...")
                     self.log_event(f"Waiting for output file access: {os.path.basename(export_path)}")
-                    time.sleep(2)
+                    if self.stop_event.wait(2): return False  # Monitoring stopped while waiting
                     retry_count += 1
                     continue
 
                 if self.check_file_lock(file_path):
                     logger_app.warning(f"Input file {file_path} is locked. Waiting for access...")
                     self.log_event(f"Waiting for input file access: {os.path.basename(file_path)}")
-                    time.sleep(2)
+                    if self.stop_event.wait(2): return False  # Monitoring stopped while waiting
                     retry_count += 1
                     continue
 
                 if not self.verify_file_consistency(file_path):
-                    logger_app.info(f"Waiting for file {file_path} to stabilize...")
-                    time.sleep(2)
+                    logger_app.info("Waiting for file %s to stabilize...", file_path)
+                    if self.stop_event.wait(2): return False  # Monitoring stopped while waiting
                     continue
 
-                MonitorFolderDialog._retry_pause_active = True
-                self.temp_output_path = export_path + '.partial'
-                temp_dir = None
-                temp_audio_path = None
+                temp_output_path = export_path + '.partial'
+                self.temp_output_paths.add(temp_output_path)
                 try:
-                    # Set global transcription state
-                    transcription_state.set_transcribing(True)
                     self.log_event(f"TRANSCRIPTION PROCESS STARTING for {os.path.basename(file_path)}")
                     logger_app.info(f"[MONITOR] === BEGINNING ACTUAL TRANSCRIPTION PROCESS FOR {file_path} ===")
                     
-                    # 1. Extract audio from video
-                    temp_dir = tempfile.mkdtemp(prefix="wc_temp_")
-                    temp_audio_path = os.path.join(temp_dir, "temp_audio.wav")
-                    cmd = [
-                        "ffmpeg", "-i", file_path, "-y", "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1", temp_audio_path
-                    ]
-                    logger_app.info(f"[MONITOR] FFMPEG cmd: {' '.join(cmd)}")
-                    res = subprocess.run(cmd, capture_output=True, text=True, errors='replace', creationflags=subprocess.CREATE_NO_WINDOW if os.name=='nt' else 0)
-                    if res.returncode != 0:
-                        logger_app.error(f"[MONITOR] FFMPEG audio extraction error: {res.stderr}")
-                        self.log_event(f"FFMPEG extract error: {res.stderr[:150]}...")
-                        return False
-                    if not os.path.exists(temp_audio_path) or os.path.getsize(temp_audio_path) == 0:
-                        logger_app.error(f"[MONITOR] FFMPEG OK but output missing/empty: '{temp_audio_path}'")
-                        self.log_event("FFMPEG produced no audio data.")
-                        return False
-                    logger_app.info("[MONITOR] Audio extraction OK.")
-
-                    # 2. Load Whisper and transcribe
-                    logger_app.info(f"[MONITOR] Loading Whisper model '{model_name}' on '{device}'.")
-                    model = whisper.load_model(model_name, device=device)
+                    # 1. Decode audio from video into memory, meanwhile loading/warming the model the header's duration calls for
+                    logger_app.info(f"[MONITOR] Extracting audio from '{file_path}' with PyAV.")
+                    probed_duration = probe_duration(file_path)
+                    pcm_future = extract_pcm_async(file_path)
+                    if probed_duration is not None:  # Unknown length: don't guess, a wrong preload would evict a cached model
+                        load_whisper_model(self._model_for_duration(probed_duration), device, backend, compute_type)
+                    pcm, extract_err = collect_pcm(pcm_future, file_path)
+                    if pcm is None: self.log_event(extract_err); return False
+                    duration = pcm.size / AUDIO_SAMPLE_RATE
+
+                    # 2. Load Whisper (lighter model for short clips; both stay in the model cache) and transcribe
+                    model_name = self._model_for_duration(duration)
+                    if model_name != self.model_policy["long"]:
+                        logger_app.info(f"[MONITOR] Clip is {duration:.1f}s (< {self.short_clip_seconds}s), using short-clip model '{model_name}'.")
+                    logger_app.info(f"[MONITOR] Loading Whisper model '{model_name}' on '{device}' ({backend}, {compute_type}).")
+                    model = load_whisper_model(model_name, device, backend, compute_type)
                     logger_app.info("[MONITOR] Model loaded.")
-                    logger_app.info(f"[MONITOR] Starting transcription... (Audio: '{temp_audio_path}')")
-                    res_dict = model.transcribe(temp_audio_path, verbose=True)
+                    logger_app.info(f"[MONITOR] Starting transcription... ({duration:.1f}s of audio)")
+                    res_dict = run_transcription(model, pcm, device, backend, compute_type, should_stop=self.stop_event.is_set)
                     logger_app.info("[MONITOR] transcribe() call completed.")
+                    if self.stop_event.is_set():
+                        logger_app.warning(f"[MONITOR] Monitoring stopped mid-transcription; discarding partial result for {file_path}")
+                        return False
                     if res_dict is None:
                         logger_app.error("[MONITOR] Transcription result is None!")
                         self.log_event("Transcription returned no result.")
                         return False
 
                     # 3. Write transcript to temp file, then move to final output
-                    segments = res_dict.get("segments")
-                    full_txt = res_dict.get("text", "").strip()
-                    with open(self.temp_output_path, "w", encoding="utf-8") as f:
-                        f.write(f"Transcription of {file_path}\n\n")  # Add header so it's clear it's a real transcript
-                        if segments and any(seg['text'].strip() for seg in segments):
-                            for i, seg in enumerate(segments):
-                                f.write(f"[{format_timestamp_for_transcript(seg['start'])} --> {format_timestamp_for_transcript(seg['end'])}] {seg['text'].strip()}\n")
-                                if i % 100 == 0:
-                                    f.flush()
-                        elif full_txt:
-                            f.write(full_txt + ("\n" if full_txt else ""))
-                        else:
-                            error_msg = "[ERROR] Whisper returned no transcript data. Check logs for details."
-                            logger_app.error(f"[MONITOR] {error_msg}")
-                            f.write(error_msg + "\n")
-                    # Move to final output
-                    if os.path.exists(export_path):
-                        os.remove(export_path)
-                    os.rename(self.temp_output_path, export_path)
-                    self.temp_output_path = None
+                    error_msg = "[ERROR] Whisper returned no transcript data. Check logs for details."
+                    # Header makes it clear it's a real transcript
+                    if not write_transcript(temp_output_path, res_dict, header=f"Transcription of {file_path}\n\n", empty_text=error_msg + "\n", durable=True):
+                        logger_app.error(f"[MONITOR] {error_msg}")
+                    # Move to final output (atomic, overwrites any previous transcript)
+                    os.replace(temp_output_path, export_path)
                     logger_app.info(f"[MONITOR] Transcript written successfully to {export_path}")
 
                     # 4. Move video file to output folder
@@ -818,48 +1284,58 @@ class MonitorFolderDialog(QDialog):
                         logger_app.warning(f"[MONITOR] Failed to move video file: {e}")
                         self.log_event(f"Failed to move video file: {str(e)[:150]}")
 
-                    # Clean up temp audio
-                    if temp_audio_path and os.path.exists(temp_audio_path):
-                        try:
-                            os.remove(temp_audio_path)
-                        except Exception as e:
-                            logger_app.warning(f"[MONITOR] Failed to clean up temp audio: {e}")
-                    if temp_dir and os.path.exists(temp_dir):
-                        try:
-                            shutil.rmtree(temp_dir)
-                        except Exception as e:
-                            logger_app.warning(f"[MONITOR] Failed to clean up temp dir: {e}")
-
                     return True
                 finally:
-                    # Always clear transcription state
-                    transcription_state.set_transcribing(False)
                     logger_app.info(f"[MONITOR] === TRANSCRIPTION PROCESS COMPLETED FOR {file_path} ===")
-                    MonitorFolderDialog._retry_pause_active = False
-                    if self.temp_output_path and os.path.exists(self.temp_output_path):
+                    self.temp_output_paths.discard(temp_output_path)
+                    if os.path.exists(temp_output_path):
                         try:
-                            os.remove(self.temp_output_path)
+                            os.remove(temp_output_path)
                         except Exception as e:
-                            logger_app.warning(f"Failed to clean up temp file {self.temp_output_path}: {e}")
-                        self.temp_output_path = None
+                            logger_app.warning(f"Failed to clean up temp file {temp_output_path}: {e}")
             except Exception as e:
+                if isinstance(e, PermissionError) and not self._verify_transfer_permissions(file_path, export_path, self._check_folder_permissions):
+                    return False # Uncached re-check confirmed access was lost
                 retry_count += 1
                 if retry_count <= max_retries:
                     wait_time = 2 ** retry_count  # Exponential backoff
                     logger_app.warning(f"Transcription attempt {retry_count} failed: {e}. Retrying in {wait_time} seconds...")
                     self.log_event(f"Retry {retry_count}/{max_retries} for {os.path.basename(file_path)}")
-                    time.sleep(wait_time)
+                    if self.stop_event.wait(wait_time): return False
                 else:
                     logger_app.error(f"All transcription attempts failed for {file_path}: {e}")
                     self.log_event(f"FAILED: {os.path.basename(file_path)} after {max_retries} retries")
                     return False
 
+    def _setup_event_log(self):
+        """
+        Routes log_event() to monitor_system.log through a MemoryHandler, so events are written in batches.
+        The buffer flushes when full, on ERROR-level events, every 5 s, and on stop/close.
+        """
+        file_handler = logging.FileHandler(self.log_path, mode='a', encoding='utf-8', delay=True)
+        file_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+        self.event_log_handler = logging.handlers.MemoryHandler(512, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True)
+        self.event_logger = logging.getLogger(f"WhisperCreepApp.MonitorEvents.{self.monitor_id}")
+        self.event_logger.propagate = False # monitor_system.log only, not the console/run logs
+        self.event_logger.setLevel(logging.INFO)
+        self.event_logger.addHandler(self.event_log_handler)
+        self.event_log_flush_timer = QTimer(self)
+        self.event_log_flush_timer.timeout.connect(self.event_log_handler.flush)
+        self.event_log_flush_timer.start(5000)
+
+    def _close_event_log(self):
+        self.event_log_flush_timer.stop()
+        self.event_logger.removeHandler(self.event_log_handler)
+        self.event_log_handler.close() # Flushes the buffer, then closes the file handler
+        self.event_log_handler.target.close()
+
     def log_event(self, message, src_path=None, dest_path=None):
         # Enhanced logging: include src and dest if provided and if START or DONE
         if (message.startswith("START:") or message.startswith("DONE:")) and src_path and dest_path:
             message = f"{message} | Src: {src_path} | Dest: {dest_path}"
-        with open(self.log_path, 'a', encoding='utf-8') as logf:
-            logf.write(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}\n")
+        # Failures are logged at ERROR so they reach the file immediately
+        is_failure = message.startswith(("ERROR", "FATAL", "FAILED"))
+        self.event_logger.log(logging.ERROR if is_failure else logging.INFO, message)
 
     def closeEvent(self, event):
         if self.monitoring:
@@ -873,17 +1349,22 @@ class MonitorFolderDialog(QDialog):
             self.stop_monitoring()
         
         # Clean up any remaining temp files
-        if self.temp_output_path and os.path.exists(self.temp_output_path):
-            try:
-                os.remove(self.temp_output_path)
-            except Exception as e:
-                logger_app.warning(f"Failed to clean up temp file {self.temp_output_path}: {e}")
+        for temp_path in list(self.temp_output_paths):
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except Exception as e:
+                    logger_app.warning(f"Failed to clean up temp file {temp_path}: {e}")
+        self.temp_output_paths.clear()
         
         MonitorFolderDialog._instances.discard(self)
         self.tray_icon.hide()
-        self.stop_event.set()
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=2)
+        self._request_monitor_stop()
+        self._wait_for_monitor_thread()
+        # Last monitor gone and no manual run active: free the models' (GPU) memory
+        if transcription_state.active_monitor_count == 0 and not transcription_state.is_transcribing:
+            release_whisper_models()
+        self._close_event_log()
         event.accept()
 
     def showNormal(self):
@@ -895,17 +1376,29 @@ class MonitorFolderDialog(QDialog):
 class WhisperWorker(QObject):
     finished_with_path = Signal(str) 
     error = Signal(str)
-    def __init__(self, mode, source_file, determined_dest_file_path, model_name="base", device=None):
+    status = Signal(str) # Short progress text for the processing dialog
+    run_finished = Signal() # End of every run, after any finished_with_path/error
+    job_requested = Signal(dict) # configure() kwargs for one run, emitted from the GUI thread and handled on the worker thread
+    def __init__(self):
         super().__init__()
+        self._is_running=True
+        self.job_requested.connect(self.start)
+    @Slot(dict)
+    def start(self, job):
+        """Runs one job; the worker and its thread live for the whole session instead of being rebuilt per run."""
+        try: self.configure(**job)
+        except Exception as e: logger_worker.critical("Worker configure failed", exc_info=True); self.error.emit(f"General worker error: {e}"); self.run_finished.emit(); return
+        self.run()
+    def configure(self, mode, source_file, determined_dest_file_path, model_name="base", device=None, backend=DEFAULT_WHISPER_BACKEND, precision="auto", decoding=DEFAULT_DECODING):
         self.mode=mode; self.source_file=source_file; self.dest_file_path=determined_dest_file_path
-        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self.device = device or ("cuda" if cuda_available() else "cpu")
         if self.device == "cpu":
             logger_worker.warning("CUDA not available, falling back to CPU. This will be slower.")
         else:
             logger_worker.info("CUDA is available, using GPU acceleration.")
-        self.model_name=model_name
-        self._is_running=True; self.temp_dir=None; self.temp_audio_path=None
-        logger_worker.info(f"Worker init. Mode:{self.mode}, Src:'{self.source_file}', Dest:'{self.dest_file_path}', Model:{self.model_name}, Dev:{self.device}")
+        self.model_name=model_name; self.backend=backend; self.compute_type=resolve_compute_type(precision, self.device); self.decoding=decoding
+        self._is_running=True
+        logger_worker.info(f"Worker configured. Mode:{self.mode}, Src:'{self.source_file}', Dest:'{self.dest_file_path}', Model:{self.model_name}, Backend:{self.backend}, Dev:{self.device}, Compute:{self.compute_type}, Decoding:{self.decoding}")
     def run(self):
         op_ok=False; out_path_sig=""; start_time=time.time()
         logger_worker.info("Worker run method started.")
@@ -913,20 +1406,13 @@ class WhisperWorker(QObject):
             if os.name == 'nt': bring_console_to_front()
             logger_worker.debug("--- Worker Log Segment Start ---")
             logger_worker.info("Starting worker process execution...")
-            audio_path = self.source_file
+            audio = self.source_file # File path for audio_transcript; in-memory PCM for video_transcript
+            pcm_future = None
             if not self._is_running: logger_worker.warning("Stop at run start."); return
             if self.mode == "video_transcript":
-                logger_worker.info(f"Extracting audio from '{self.source_file}' for transcription.")
-                self.temp_dir = tempfile.mkdtemp(prefix="wc_temp_")
-                self.temp_audio_path = os.path.join(self.temp_dir, "temp_audio.wav")
-                cmd = ["ffmpeg","-i",self.source_file,"-y","-vn","-acodec","pcm_s16le","-ar","16000","-ac","1",self.temp_audio_path]
-                logger_worker.info(f"FFMPEG cmd: {' '.join(cmd)}")
-                res = subprocess.run(cmd, capture_output=True, text=True, errors='replace', creationflags=subprocess.CREATE_NO_WINDOW if os.name=='nt' else 0)
-                if res.returncode!=0: logger_worker.error(f"FFMPEG audio extraction error: {res.stderr}"); self.error.emit(f"FFMPEG extract error: {res.stderr[:150]}..."); return
-                if not os.path.exists(self.temp_audio_path) or os.path.getsize(self.temp_audio_path)==0:
-                    logger_worker.error(f"FFMPEG OK but output missing/empty:'{self.temp_audio_path}'"); self.error.emit("FFMPEG produced no audio data."); return
-                logger_worker.info("Audio extraction OK."); audio_path = self.temp_audio_path
-            if not self._is_running: logger_worker.warning("Stop after extract."); return
+                # Extract in the background so decoding overlaps the model load/warm-up below
+                logger_worker.info(f"Extracting audio from '{self.source_file}' for transcription (in memory)."); self.status.emit("Extracting audio...")
+                pcm_future = extract_pcm_async(self.source_file)
             if self.mode == "rip_audio":
                 logger_worker.info(f"Ripping audio to '{self.dest_file_path}'.")
                 parent_dir = os.path.dirname(self.dest_file_path); os.makedirs(parent_dir, exist_ok=True)
@@ -938,15 +1424,25 @@ class WhisperWorker(QObject):
                     logger_worker.info(f"Audio rip OK: '{self.dest_file_path}'"); op_ok=True; out_path_sig=self.dest_file_path
                 else: logger_worker.error(f"Audio rip output missing/empty:'{self.dest_file_path}'"); self.error.emit("Audio rip output error.")
             elif self.mode in ["video_transcript", "audio_transcript"]:
-                logger_worker.info(f"Loading Whisper model '{self.model_name}' on '{self.device}'.")
-                try: self.model = whisper.load_model(self.model_name, device=self.device); logger_worker.info("Model loaded.")
+                logger_worker.info(f"Loading Whisper model '{self.model_name}' on '{self.device}' ({self.backend}, {self.compute_type}).")
+                try: self.model = load_whisper_model(self.model_name, self.device, self.backend, self.compute_type, on_warmup=lambda: self.status.emit("Warming up model...")); logger_worker.info("Model loaded.")
                 except Exception as e: logger_worker.error("Model load failed",exc_info=True); self.error.emit(f"Model load error: {e}"); return
                 if not self._is_running: logger_worker.warning("Stop after model load."); return
-                logger_worker.info(f"Starting transcription... (Audio: '{audio_path}')")
-                if not os.path.exists(audio_path): logger_worker.error(f"Audio for transcribe missing:'{audio_path}'"); self.error.emit(f"Audio missing: {os.path.basename(audio_path)}"); return
-                if os.path.getsize(audio_path)==0: logger_worker.error(f"Audio for transcribe empty:'{audio_path}'"); self.error.emit(f"Audio empty: {os.path.basename(audio_path)}"); return
+                if pcm_future:
+                    if not pcm_future.done(): self.status.emit("Extracting audio...")
+                    pcm, extract_err = collect_pcm(pcm_future, self.source_file, logger_worker)
+                    if pcm is None: self.error.emit(extract_err); return
+                    audio = pcm
+                    if not self._is_running: logger_worker.warning("Stop after extract."); return
+                self.status.emit("Transcribing...")
+                if isinstance(audio, str):
+                    logger_worker.info(f"Starting transcription... (Audio: '{audio}')")
+                    if not os.path.exists(audio): logger_worker.error(f"Audio for transcribe missing:'{audio}'"); self.error.emit(f"Audio missing: {os.path.basename(audio)}"); return
+                    if os.path.getsize(audio)==0: logger_worker.error(f"Audio for transcribe empty:'{audio}'"); self.error.emit(f"Audio empty: {os.path.basename(audio)}"); return
+                else: logger_worker.info(f"Starting transcription... ({audio.size / AUDIO_SAMPLE_RATE:.1f}s of in-memory audio)")
                 res_dict = None
-                try: res_dict = self.model.transcribe(audio_path, verbose=True)
+                try:
+                    res_dict = run_transcription(self.model, audio, self.device, self.backend, self.compute_type, should_stop=lambda: not self._is_running, decoding=self.decoding)
                 except Exception as e: logger_worker.critical("transcribe() call failed!",exc_info=True); self.error.emit(f"Transcription error: {e}"); return
                 logger_worker.info("transcribe() call completed.")
                 if res_dict is None: logger_worker.error("Transcription result is None!"); self.error.emit("Transcription returned no result."); return
@@ -954,16 +1450,7 @@ class WhisperWorker(QObject):
                 try:
                     segments = res_dict.get("segments")
                     logger_worker.info(f"Preparing to write transcript to '{self.dest_file_path}'. Segments: {len(segments) if segments else 'N/A'}.")
-                    with open(self.dest_file_path, "w", encoding="utf-8") as f:
-                        if segments:
-                            for i, seg in enumerate(segments):
-                                if not self._is_running: logger_worker.warning("Stop during segment write."); break
-                                f.write(f"[{format_timestamp_for_transcript(seg['start'])} --> {format_timestamp_for_transcript(seg['end'])}] {seg['text'].strip()}\n")
-                                if i%100==0: f.flush() 
-                        else: 
-                            full_txt = res_dict.get("text","").strip()
-                            logger_worker.warning(f"No segments. Writing full text (len {len(full_txt)}).")
-                            f.write(full_txt + ("\n" if full_txt else ""))
+                    if not write_transcript(self.dest_file_path, res_dict): logger_worker.warning("Whisper returned no transcript text; wrote an empty file.")
                     if self._is_running: logger_worker.info(f"Transcript saved: '{self.dest_file_path}'"); op_ok=True; out_path_sig=self.dest_file_path
                     else: logger_worker.info(f"Write interrupted. Partial file at '{self.dest_file_path}'"); out_path_sig=self.dest_file_path 
                 except Exception as e: logger_worker.error(f"Transcript write failed for '{self.dest_file_path}'",exc_info=True); self.error.emit(f"Transcript write error: {e}")
@@ -971,7 +1458,6 @@ class WhisperWorker(QObject):
         except Exception as e: logger_worker.critical("Unhandled worker exception",exc_info=True); self.error.emit(f"General worker error: {e}")
         finally:
             total_t = time.time()-start_time; logger_worker.info(f"Worker 'finally'. Time:{total_t:.2f}s. OpOK:{op_ok}. Running:{self._is_running}")
-            self.cleanup()
             if op_ok and out_path_sig and self._is_running:
                 logger_worker.info(f"Emitting finished_with_path: '{out_path_sig}' (Success)")
                 self.finished_with_path.emit(out_path_sig)
@@ -979,14 +1465,8 @@ class WhisperWorker(QObject):
                 logger_worker.warning(f"Emitting finished_with_path: '{out_path_sig}' (OpOK:{op_ok}, Running:{self._is_running}. Error/Stop likely.)")
                 self.finished_with_path.emit(out_path_sig) 
             logger_worker.info("Worker run method fully completed.\n--- Worker Log Segment End ---")
+            self.run_finished.emit()
     def stop(self): logger_worker.info("Worker stop method called."); self._is_running = False
-    def cleanup(self):
-        logger_worker.info(f"Cleanup. Temp dir:'{self.temp_dir}'")
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            try: shutil.rmtree(self.temp_dir); logger_worker.info(f"Cleaned temp:'{self.temp_dir}'")
-            except Exception as e: logger_worker.warning(f"Failed to clean temp:'{self.temp_dir}':{e}",exc_info=True)
-        else: logger_worker.debug("No temp dir to clean.")
-        self.temp_dir=None; self.temp_audio_path=None; logger_worker.info("Cleanup finished.")
 
 # --- Subclass QMenu to force tooltips on hover ---
 class PsychoMenu(QMenu):
@@ -1004,18 +1484,26 @@ class PsychoMenu(QMenu):
 
 # --- Main GUI Class (Based on User's Original Structure) ---
 class WhisperCreepInterface(QMainWindow):
+    # Source file dialog filter per operation
+    _FILE_FILTERS = {
+        "video_transcript": "Video (*.mp4 *.mov *.avi *.wmv *.mkv);;All (*)",
+        "rip_audio": "Video (*.mp4 *.mov *.avi *.wmv *.mkv);;All (*)",
+        "audio_transcript": "Audio (*.mp3 *.wav *.m4a);;All (*)",
+    }
     def __init__(self):
         super().__init__()
-        self.app_start_time = time.time()
-        logger_app.info(f"UI initializing. Version: {APP_VERSION}. App Start: {datetime.datetime.fromtimestamp(self.app_start_time).strftime('%Y-%m-%d %H:%M:%S')}")
+        self.app_start_time = time.monotonic() # Uptime clock; wall-clock times come from the log formatter's asctime
+        logger_app.info("UI initializing. Version: %s.", APP_VERSION)
         self.source_file_path = None
         self.whisper_worker = None
         self.whisper_thread = None
         self.processing_dialog = None
         self.was_killed_by_user = False
         self.current_run_file_handler = None
-        self.tray_icon = None
-        self.setup_tray_icon()
+        self._dark_title_bar_applied = False # Set by the first showEvent on Windows
+        self.tray_icon = None # Created just after the first paint (see end of __init__)
+        self._tray_menu = None # Tray context menu, built once by _build_tray_menu
+        self._last_processing_state = None # Last state applied by _update_gui_for_processing_state
         self.setWindowTitle("WhisperCreep Control Room")
         self.setMinimumWidth(800)
         self.setMinimumHeight(600)
@@ -1061,9 +1549,9 @@ class WhisperCreepInterface(QMainWindow):
         exit_action.triggered.connect(self.close)
         
         # Use PsychoMenu for Tools menu to force tooltips
-        tools_menu = PsychoMenu("Tools", self)
-        tools_menu.setStyleSheet("QMenu { background-color: #0d0000; color: white; } QMenu::item:selected { background-color: #333333; }")
-        menu_bar.addMenu(tools_menu)
+        self.tools_menu = PsychoMenu("Tools", self) # Actions are added after the first paint by _install_tools_menu
+        self.tools_menu.setStyleSheet("QMenu { background-color: #0d0000; color: white; } QMenu::item:selected { background-color: #333333; }")
+        menu_bar.addMenu(self.tools_menu)
         
         help_menu = menu_bar.addMenu("Help")
         central_widget = QWidget()
@@ -1089,6 +1577,10 @@ class WhisperCreepInterface(QMainWindow):
                     ("rip_audio", "Rip Audio from Video", "Extract audio track (MP3) from video.", ".mp4..."), # NoQA: E501
                     ("audio_transcript", "Extract Audio Transcript", "Transcribe an audio-only file.", ".mp3...")] # NoQA: E501
         gb_style = "QGroupBox{background-color:#1A1A1A;color:white;border:1px solid #333333;padding:10px;margin-top:1ex;}QGroupBox::title{subcontrol-origin:margin;subcontrol-position:top left;padding:0 10px;font-weight:bold;}"
+        # Operation rows share one container so processing can disable them with a single setEnabled
+        self.ops_box = QWidget()
+        ops_lo = QVBoxLayout(self.ops_box); ops_lo.setContentsMargins(0, 0, 0, 0)
+        main_layout.addWidget(self.ops_box)
         for n, t, d, ft in ops_data:
             rb = QRadioButton()
             rb.setObjectName(n)
@@ -1100,7 +1592,7 @@ class WhisperCreepInterface(QMainWindow):
             gb = QGroupBox(t)
             gb.setStyleSheet(gb_style)
             gb.setLayout(create_option_row(d, hb, rb))
-            main_layout.addWidget(gb)
+            ops_lo.addWidget(gb)
         src_gb = QGroupBox("Select Source File")
         src_gb.setStyleSheet(gb_style)
         src_lo = QHBoxLayout()
@@ -1125,7 +1617,7 @@ class WhisperCreepInterface(QMainWindow):
         dst_lo.addWidget(self.dst_info_lbl)
         dst_gb.setLayout(dst_lo)
         main_layout.addWidget(dst_gb)
-        mdl_gb = QGroupBox("Select Whisper Model")
+        mdl_gb = self.mdl_gb = QGroupBox("Select Whisper Model") # Disabled as a whole while processing
         mdl_gb.setStyleSheet(gb_style)
         mdl_lo = QHBoxLayout()
         self.mdl_combo = QComboBox()
@@ -1136,6 +1628,29 @@ class WhisperCreepInterface(QMainWindow):
         model_size_label.setStyleSheet("font-family:Calibri; font-size:11pt; background-color: #1A1A1A; color: white;")
         mdl_lo.addWidget(model_size_label)
         mdl_lo.addWidget(self.mdl_combo)
+        self.backend_combo = QComboBox()
+        self.backend_combo.addItems(WHISPER_BACKENDS)
+        self.backend_combo.setCurrentText(DEFAULT_WHISPER_BACKEND)
+        backend_label = QLabel("Backend:")
+        backend_label.setStyleSheet("font-family:Calibri; font-size:11pt; background-color: #1A1A1A; color: white;")
+        mdl_lo.addWidget(backend_label)
+        mdl_lo.addWidget(self.backend_combo)
+        self.precision_combo = QComboBox()
+        self.precision_combo.addItems(PRECISION_OPTIONS)
+        self.precision_combo.setCurrentText("auto")
+        self.precision_combo.setToolTip("auto: FP16 on GPU, dynamic INT8 on CPU")
+        precision_label = QLabel("Precision:")
+        precision_label.setStyleSheet("font-family:Calibri; font-size:11pt; background-color: #1A1A1A; color: white;")
+        mdl_lo.addWidget(precision_label)
+        mdl_lo.addWidget(self.precision_combo)
+        self.decoding_combo = QComboBox()
+        self.decoding_combo.addItems(DECODING_OPTIONS)
+        self.decoding_combo.setCurrentText(DEFAULT_DECODING)
+        self.decoding_combo.setToolTip("fast: skip silence (VAD) and decode greedily; accurate: beam search over all audio")
+        decoding_label = QLabel("Decoding:")
+        decoding_label.setStyleSheet("font-family:Calibri; font-size:11pt; background-color: #1A1A1A; color: white;")
+        mdl_lo.addWidget(decoding_label)
+        mdl_lo.addWidget(self.decoding_combo)
         mdl_gb.setLayout(mdl_lo)
         main_layout.addWidget(mdl_gb)
         btm_lo = QHBoxLayout()
@@ -1160,93 +1675,45 @@ class WhisperCreepInterface(QMainWindow):
         btm_lo.addWidget(cls_btn)
         main_layout.addLayout(btm_lo)
         logger_app.info("UI widgets created (original structure).")
-
-        # New menu option
-        monitor_action = tools_menu.addAction("Monitor Folder for Video")
-        monitor_action.setToolTip("Monitor a folder and auto transcribe video files.")
-        monitor_action.triggered.connect(self.open_monitor_dialog)
-        
-        # Add Frame Snatcher to tools menu
-        frame_snatcher_action = tools_menu.addAction("Frame Snatcher")
-        frame_snatcher_action.setToolTip("Choose to create still frames from a video for analysis")
-        frame_snatcher_action.triggered.connect(self.open_frame_snatcher)
-
-        # Add YouTube Caption Fetcher to tools menu
-        youtube_caption_action = tools_menu.addAction("YouTube Caption Fetcher")
-        youtube_caption_action.setToolTip("Download and clean captions from YouTube videos")
-        youtube_caption_action.triggered.connect(self.open_youtube_caption_fetcher)
-
-        # Add Website to PDF to tools menu
-        webtopdf_action = tools_menu.addAction("WebPage to PDF")
-        webtopdf_action.setToolTip("Convert websites to PDF documents")
-        webtopdf_action.triggered.connect(lambda: os.system(f'python "{os.path.join(os.path.dirname(os.path.abspath(__file__)), "webtopdf_gui.py")}"'))
+        # Tray icon and tool actions aren't needed for the first frame; post them to the event loop
+        QTimer.singleShot(0, self.setup_tray_icon)
+        QTimer.singleShot(50, self._install_tools_menu)
+
+    def _install_tools_menu(self):
+        # (label, tooltip, slot) per Tools entry, added in one pass
+        tools = [
+            ("Monitor Folder for Video", "Monitor a folder and auto transcribe video files.", self.open_monitor_dialog),
+            ("Frame Snatcher", "Choose to create still frames from a video for analysis", self.open_frame_snatcher),
+            ("YouTube Caption Fetcher", "Download and clean captions from YouTube videos", self.open_youtube_caption_fetcher),
+            ("WebPage to PDF", "Convert websites to PDF documents", self.open_webtopdf),
+        ]
+        for label, tip, slot in tools:
+            action = self.tools_menu.addAction(label); action.setToolTip(tip); action.triggered.connect(slot)
+
+    def open_webtopdf(self):
+        """Starts the WebPage to PDF tool as a detached child with this interpreter (no shell, UI stays responsive)"""
+        logger_app.info("Opening WebPage to PDF tool")
+        QProcess.startDetached(sys.executable, [os.path.join(SCRIPT_DIR, "webtopdf_gui.py")])
 
     def setup_tray_icon(self):
         self.tray_icon = QSystemTrayIcon(self)
-        # Try to load the custom icon from config first
-        icon_loaded = False
-        try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            config_path = os.path.join(script_dir, "config.ini")
-            
-            if os.path.exists(config_path):
-                config = configparser.ConfigParser()
-                config.read(config_path)
-                
-                if config.has_section('UI') and config.has_option('UI', 'icon_path'):
-                    icon_path = os.path.join(script_dir, config.get('UI', 'icon_path'))
-                    logger_app.info(f"Attempting to load custom icon from config: {icon_path}")
-                    
-                    if os.path.exists(icon_path):
-                        icon = QIcon(icon_path)
-                        if not icon.isNull():
-                            self.tray_icon.setIcon(icon)
-                            self.setWindowIcon(icon)
-                            app = QApplication.instance()
-                            app.setWindowIcon(icon)
-                            logger_app.info(f"Successfully loaded custom icon from: {icon_path}")
-                            icon_loaded = True
-                        else:
-                            raise Exception("Custom icon loaded but is null")
-                    else:
-                        logger_app.warning(f"Custom icon file not found at: {icon_path}")
-        except Exception as e:
-            logger_app.error(f"Error loading custom icon from config: {e}")
-        
-        # Fall back to default icon if custom wasn't loaded
-        if not icon_loaded:
-            try:
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                icon_path = os.path.join(script_dir, "WhisperCreepICO.ico")
-                logger_app.info(f"Attempting to load default icon from: {icon_path}")
-                
-                if os.path.exists(icon_path):
-                    icon = QIcon(icon_path)
-                    if not icon.isNull():
-                        self.tray_icon.setIcon(icon)
-                        self.setWindowIcon(icon)
-                        app = QApplication.instance()
-                        app.setWindowIcon(icon)
-                        logger_app.info(f"Successfully loaded default icon from: {icon_path}")
-                    else:
-                        raise Exception("Icon loaded but is null")
-                else:
-                    raise FileNotFoundError(f"Icon file not found at: {icon_path}")
-            except Exception as e:
-                logger_app.error(f"Error loading default icon: {e}")
-                self.tray_icon.setIcon(QIcon.fromTheme("system-run", QIcon.fromTheme("applications-system")))
-                logger_app.info("Using system default icon for main window")
+        self.tray_icon.setIcon(app_icon()); self.setWindowIcon(app_icon()) # Decoded once in __main__, no file I/O here
         
         self.tray_icon.setToolTip("WhisperCreep Main Window")
-        menu = QMenu()
+        self.tray_icon.setContextMenu(self._tray_menu or self._build_tray_menu())
+        self.tray_icon.activated.connect(self.on_tray_activated)
+
+    def _build_tray_menu(self):
+        """Builds the tray context menu once; it's owned by the window, so a re-created tray icon reuses it."""
+        menu = QMenu(self)
         restore_action = QAction("Restore Main Window", self)
         restore_action.triggered.connect(self.showNormal)
         menu.addAction(restore_action)
         quit_action = QAction("Quit Application", self)
         quit_action.triggered.connect(self.close)
         menu.addAction(quit_action)
-        self.tray_icon.setContextMenu(menu)
-        self.tray_icon.activated.connect(self.on_tray_activated)
+        self._tray_menu = menu
+        return menu
 
     def minimize_to_tray(self):
         if not self.tray_icon.isVisible():
@@ -1260,11 +1727,10 @@ class WhisperCreepInterface(QMainWindow):
             self.raise_()
             self.activateWindow()
             # Check if monitoring dialog exists and restore it too
-            for widget in QApplication.topLevelWidgets():
-                if isinstance(widget, MonitorFolderDialog) and widget.monitoring:
-                    widget.showNormal()
-                    widget.raise_()
-                    widget.activateWindow()
+            for widget in MonitorFolderDialog.active_monitors():
+                widget.showNormal()
+                widget.raise_()
+                widget.activateWindow()
 
     def open_monitor_dialog(self):
         global transcription_in_progress
@@ -1277,13 +1743,13 @@ class WhisperCreepInterface(QMainWindow):
     def open_frame_snatcher(self):
         """Opens the Frame Snatcher tool in a new window"""
         logger_app.info("Opening Frame Snatcher tool")
-        self.frame_snatcher = VideoFrameSnatcher()
+        self.frame_snatcher = lazy_attr("video_frame_snatcher", "VideoFrameSnatcher")()
         self.frame_snatcher.show()
 
     def open_youtube_caption_fetcher(self):
         """Opens the YouTube Caption Fetcher tool in a new window"""
         logger_app.info("Opening YouTube Caption Fetcher tool")
-        self.youtube_caption_fetcher = YouTubeCaptionFetcher()
+        self.youtube_caption_fetcher = lazy_attr("youtube_captionfetcher", "YouTubeCaptionFetcher")()
         self.youtube_caption_fetcher.show()
 
     def start_processing(self):
@@ -1293,11 +1759,10 @@ class WhisperCreepInterface(QMainWindow):
             return
         transcription_in_progress = True
         self.tray_icon.setToolTip("WhisperCreep Control Room - Transcription in Progress")
-        run_start_time = datetime.datetime.now()
         # Close any previous run's specific log handler FIRST
         self._close_run_specific_logging() 
 
-        logger_app.info(f"--- User clicked 'Run' at {run_start_time.strftime('%Y-%m-%d %H:%M:%S')} ---")
+        logger_app.info("--- User clicked 'Run' ---")
         self.was_killed_by_user = False 
         
         sel_op_btn = self.button_group.checkedButton()
@@ -1311,102 +1776,127 @@ class WhisperCreepInterface(QMainWindow):
         if not self._setup_run_specific_logging(log_path):
             logger_app.error("Failed to setup run-specific logging. Aborting."); return 
 
-        mode = sel_op_btn.objectName(); mdl_name = self.mdl_combo.currentText()
-        logger_app.info(f"Run Details (also logged to '{os.path.basename(log_path)}'):")
-        logger_app.info(f"  Mode: {mode}, Model: {mdl_name}")
-        logger_app.info(f"  Source: {self.source_file_path}")
-        logger_app.info(f"  Production Output: {prod_path}")
-        logger_app.info(f"  Debug Log For This Run: {log_path}")
+        mode = sel_op_btn.objectName(); mdl_name = self.mdl_combo.currentText(); backend = self.backend_combo.currentText(); precision = self.precision_combo.currentText(); decoding = self.decoding_combo.currentText()
+        logger_app.info("Run Details (also logged to '%s'):", os.path.basename(log_path))
+        logger_app.info("  Mode: %s, Model: %s, Backend: %s, Precision: %s, Decoding: %s", mode, mdl_name, backend, precision, decoding)
+        logger_app.info("  Source: %s", self.source_file_path)
+        logger_app.info("  Production Output: %s", prod_path)
+        logger_app.info("  Debug Log For This Run: %s", log_path)
         
         self._update_gui_for_processing_state(True) 
-
-        self.whisper_thread = QThread(self) 
-        self.whisper_worker = WhisperWorker(mode, self.source_file_path, prod_path, mdl_name)
+        transcription_state.set_transcribing(True)  # Monitors pause while a manual run is active
+
+        self._ensure_worker_thread()
+        self.whisper_worker.job_requested.emit(dict(mode=mode, source_file=self.source_file_path, determined_dest_file_path=prod_path, model_name=mdl_name,
+                                                    backend=backend, precision=precision, decoding=decoding))
+        logger_app.info("Job queued to worker thread.")
+
+    def _ensure_worker_thread(self):
+        """Creates the worker and its thread on the first run; later runs reuse both (signals are wired once)."""
+        if self.whisper_thread is not None: return
+        self.whisper_thread = QThread(self)
+        self.whisper_worker = WhisperWorker()
         self.whisper_worker.moveToThread(self.whisper_thread)
-        self.whisper_worker.error.connect(self.handle_worker_error) 
+        self.whisper_worker.error.connect(self.handle_worker_error)
+        self.whisper_worker.status.connect(self.handle_worker_status) 
         self.whisper_worker.finished_with_path.connect(self.handle_worker_file_saved_or_issue) 
-        self.whisper_thread.started.connect(self.whisper_worker.run)
-        self.whisper_worker.finished_with_path.connect(self.whisper_thread.quit)
-        self.whisper_worker.error.connect(self.whisper_thread.quit)   
+        self.whisper_worker.run_finished.connect(self._ensure_gui_finalized_on_run_end)
         self.whisper_thread.finished.connect(self.whisper_worker.deleteLater)
-        self.whisper_thread.finished.connect(self.whisper_thread.deleteLater)
-        self.whisper_thread.finished.connect(self._ensure_gui_finalized_on_thread_end) 
         self.whisper_thread.start(); logger_app.info("Worker thread started.")
 
-    def _ensure_gui_finalized_on_thread_end(self):
-        logger_app.debug(f"QThread 'finished' signal. run_btn text: '{self.run_btn.text()}'")
+    def _ensure_gui_finalized_on_run_end(self):
+        logger_app.debug("Worker 'run_finished' signal. run_btn text: '%s'", self.run_btn.text())
         if self.run_btn.text() == "Processing...": 
-            logger_app.warning("Thread finished, but GUI finalize may not have run. Forcing GUI state reset.")
-            self._finalize_gui_after_processing(False, "Thread ended; outcome uncertain.", self.was_killed_by_user)
+            logger_app.warning("Run finished, but GUI finalize may not have run. Forcing GUI state reset.")
+            self._finalize_gui_after_processing(False, "Run ended; outcome uncertain.", self.was_killed_by_user)
+
+    def _alert(self, level, title, text, log_text=None, **log_kwargs):
+        """Logs at level ('warning'/'error'/'critical') and shows a matching non-blocking message box (no nested event loop)."""
+        getattr(logger_app, level)(log_text or text.replace("\n", " "), **log_kwargs)
+        box = QMessageBox(QMessageBox.Icon.Warning if level == "warning" else QMessageBox.Icon.Critical, title, text, QMessageBox.StandardButton.Ok, self)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose); box.open()
 
     def handle_worker_error(self, err_msg): 
-        logger_app.error(f"Worker error: {err_msg}")
         if self.processing_dialog: self.processing_dialog.stop_animation_and_close(); self.processing_dialog = None
-        QMessageBox.critical(self, "Error", err_msg) 
+        self._alert("error", "Error", err_msg, log_text=f"Worker error: {err_msg}")
         self._finalize_gui_after_processing(False, f"Error: {err_msg}", self.was_killed_by_user)
 
+    def handle_worker_status(self, text):
+        if self.processing_dialog: self.processing_dialog.set_status(text)
+
     def handle_worker_file_saved_or_issue(self, out_path_msg):
-        logger_app.info(f"Worker finished_with_path. Path/Msg: '{out_path_msg}'")
+        logger_app.info("Worker finished_with_path. Path/Msg: '%s'", out_path_msg)
         if self.processing_dialog: self.processing_dialog.stop_animation_and_close(); self.processing_dialog = None
 
         if self.was_killed_by_user:
             msg = "Process stopped by user."
             file_info = f"Partial output (if any):\n{out_path_msg}" if out_path_msg and os.path.exists(out_path_msg) else "No output file path available or file not created."
-            logger_app.warning(f"{msg} {file_info.replace(os.linesep, ' ')}") # Log as single line
-            QMessageBox.warning(self, "Process Terminated", f"{msg}\n{file_info}")
+            self._alert("warning", "Process Terminated", f"{msg}\n{file_info}")
             self._finalize_gui_after_processing(False, f"Killed. File: {out_path_msg}", True)
             return 
 
         if os.path.exists(out_path_msg): 
             QMessageBox.information(self, "Success", f"Operation complete!\nOutput:\n{out_path_msg}")
-            logger_app.info(f"SUCCESS. Output: {out_path_msg}")
+            logger_app.info("SUCCESS. Output: %s", out_path_msg)
             self._finalize_gui_after_processing(True, out_path_msg, False)
         else:
-            QMessageBox.warning(self, "Process Note", f"Worker finished.\nPath: {out_path_msg}\nFile not created as expected or op not fully successful. Check log.")
-            logger_app.warning(f"Worker finished, path '{out_path_msg}' not existing. Check worker logs.")
+            self._alert("warning", "Process Note", f"Worker finished.\nPath: {out_path_msg}\nFile not created as expected or op not fully successful. Check log.",
+                        log_text=f"Worker finished, path '{out_path_msg}' not existing. Check worker logs.")
             self._finalize_gui_after_processing(False, f"File issue: {out_path_msg}", False)
 
     def _finalize_gui_after_processing(self, success, outcome_message_or_path, killed=False):
         global transcription_in_progress
-        transcription_in_progress = False
+        transcription_in_progress = False; transcription_state.set_transcribing(False)
         self.tray_icon.setToolTip("WhisperCreep Main Window")
-        logger_app.info(f"Finalizing GUI. Success:{success}, Killed:{killed}, Path/Msg:'{outcome_message_or_path}'")
+        logger_app.info("Finalizing GUI. Success:%s, Killed:%s, Path/Msg:'%s'", success, killed, outcome_message_or_path)
         if self.processing_dialog and self.processing_dialog.isVisible(): 
             logger_app.warning("Finalizing GUI, processing dialog still visible. Closing."); self.processing_dialog.stop_animation_and_close(); self.processing_dialog = None
         
         self._update_gui_for_processing_state(False) 
         self._close_run_specific_logging() # Close the run-specific log file
         
-        run_end_time = datetime.datetime.now()
         outcome = "Killed by user" if killed else ("Success" if success else "Failure/Error")
-        logger_app.info(f"--- GUI 'Run' handling finished at {run_end_time.strftime('%Y-%m-%d %H:%M:%S')}. Outcome: {outcome}, Details: {outcome_message_or_path} ---")
+        logger_app.info("--- GUI 'Run' handling finished. Outcome: %s, Details: %s ---", outcome, outcome_message_or_path)
 
         # Find any paused monitoring dialog and ask user about resuming
-        for widget in QApplication.topLevelWidgets():
-            if isinstance(widget, MonitorFolderDialog) and widget.monitoring:
-                logger_app.info("Manual transcription completed, asking user about monitoring...")
-                widget.log_event(f"Manual transcription completed. Outcome: {outcome}. Asking user about monitoring.")
-                reply = QMessageBox.question(self, 'Resume Monitoring?',
-                    'Your transcription is complete. Would you like to resume folder monitoring?',
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.Yes)
+        for widget in MonitorFolderDialog.active_monitors():
+            logger_app.info("Manual transcription completed, asking user about monitoring...")
+            widget.log_event(f"Manual transcription completed. Outcome: {outcome}. Asking user about monitoring.")
+            reply = QMessageBox.question(self, 'Resume Monitoring?',
+                'Your transcription is complete. Would you like to resume folder monitoring?',
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.Yes)
                 
-                if reply == QMessageBox.StandardButton.Yes:
-                    logger_app.info("User chose to resume monitoring")
-                    widget.log_event("User chose to resume monitoring")
-                    # Minimize both windows to tray
-                    self.minimize_to_tray()
-                    widget.hide()
-                else:
-                    logger_app.info("User chose to stop monitoring")
-                    widget.log_event("User chose to stop monitoring after manual transcription")
-                    widget.stop_monitoring()
+            if reply == QMessageBox.StandardButton.Yes:
+                logger_app.info("User chose to resume monitoring")
+                widget.log_event("User chose to resume monitoring")
+                # Minimize both windows to tray
+                self.minimize_to_tray()
+                widget.hide()
+            else:
+                logger_app.info("User chose to stop monitoring")
+                widget.log_event("User chose to stop monitoring after manual transcription")
+                widget.stop_monitoring()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Dark title bar once the native window exists, so DWM gets this window's real HWND
+        if os.name == 'nt' and not self._dark_title_bar_applied:
+            self._dark_title_bar_applied = True
+            if apply_dark_title_bar(int(self.winId())): logger_app.info("Windows dark mode for title bar enabled")
+            self.setStyleSheet(self.styleSheet() + "\n            QMainWindow { border: none; }\n")
+            self.setStyle(self.style()) # Force a style update
+
+    def nativeEvent(self, eventType, message):
+        # Drive mappings changed: rebuild the cached network drive map
+        if os.name == 'nt' and bytes(eventType) == b"windows_generic_MSG":
+            if wintypes.MSG.from_address(int(message)).message == WM_DEVICECHANGE: refresh_network_map()
+        return super().nativeEvent(eventType, message)
 
     def closeEvent(self, event): 
-        self.tray_icon.hide()
-        shutdown_time = datetime.datetime.now()
+        if self.tray_icon: self.tray_icon.hide()
         exit_reason = "User killed process" if self.was_killed_by_user else "Normal window close"
-        logger_app.info(f"Close event at {shutdown_time.strftime('%Y-%m-%d %H:%M:%S')}. Reason: {exit_reason}. App shutting down.")
+        logger_app.info("Close event. Reason: %s. App shutting down.", exit_reason)
         
         if self.processing_dialog: logger_app.debug("Closing active processing dialog."); self.processing_dialog.stop_animation_and_close(); self.processing_dialog = None
         if hasattr(self,'whisper_thread') and self.whisper_thread and self.whisper_thread.isRunning():
@@ -1417,8 +1907,8 @@ class WhisperCreepInterface(QMainWindow):
         
         self._close_run_specific_logging() 
         super().closeEvent(event)
-        total_uptime = time.time() - self.app_start_time
-        logger_app.info(f"--- Application Closed. Final Exit: {exit_reason}. Uptime: {total_uptime:.2f}s. ---")
+        total_uptime = time.monotonic() - self.app_start_time
+        logger_app.info("--- Application Closed. Final Exit: %s. Uptime: %.2fs. ---", exit_reason, total_uptime)
 
     def _setup_run_specific_logging(self, log_file_path):
         if not log_file_path: 
@@ -1426,45 +1916,58 @@ class WhisperCreepInterface(QMainWindow):
             return False
         try:
             if self.current_run_file_handler:
-                logger_app.debug(f"Removing previous run file handler for: {self.current_run_file_handler.baseFilename}")
+                logger_app.debug("Removing previous run file handler for: %s", self.current_run_file_handler.target.baseFilename)
                 logging.getLogger().removeHandler(self.current_run_file_handler)
-                self.current_run_file_handler.close()
+                self.current_run_file_handler.close(); self.current_run_file_handler.target.close()
             
             formatter = logging.Formatter("[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
-            file_handler = logging.FileHandler(log_file_path, mode='w', encoding='utf-8') 
+            file_handler = logging.FileHandler(log_file_path, mode='w', encoding='utf-8', delay=True) # Opened on first flush
             file_handler.setFormatter(formatter)
             file_handler.setLevel(logging.DEBUG) 
+            # Buffer records and write them in batches; ERROR and above flush at once so crash context reaches the file
+            buffered_handler = logging.handlers.MemoryHandler(1024, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True)
+            buffered_handler.setLevel(logging.DEBUG)
             
-            logging.getLogger().addHandler(file_handler) 
-            self.current_run_file_handler = file_handler
-            logger_app.info(f"--- Run-specific file logging initiated to: {log_file_path} ---")
+            logging.getLogger().addHandler(buffered_handler) 
+            self.current_run_file_handler = buffered_handler
+            logger_app.info("--- Run-specific file logging initiated to: %s ---", log_file_path)
             return True
         except Exception as e:
-            logger_app.error(f"Failed to set up run-specific file logging for '{log_file_path}': {e}", exc_info=True)
-            QMessageBox.critical(self, "Logging Error", f"Could not create run-specific log file at:\n{log_file_path}\n\nLogging will continue to console only.\nError: {e}")
+            self._alert("error", "Logging Error", f"Could not create run-specific log file at:\n{log_file_path}\n\nLogging will continue to console only.\nError: {e}",
+                        log_text=f"Failed to set up run-specific file logging for '{log_file_path}': {e}", exc_info=True)
             self.current_run_file_handler = None 
             return False
 
     def _close_run_specific_logging(self):
         if self.current_run_file_handler:
-            log_path = self.current_run_file_handler.baseFilename
-            logger_app.info(f"--- Closing run-specific logging for: {log_path} ---")
+            log_path = self.current_run_file_handler.target.baseFilename
+            logger_app.info("--- Closing run-specific logging for: %s ---", log_path)
             try:
                 logging.getLogger().removeHandler(self.current_run_file_handler)
-                self.current_run_file_handler.close()
+                self.current_run_file_handler.close() # Flushes the buffered records to the file
+                self.current_run_file_handler.target.close()
             except Exception as e: logger_app.error(f"Error closing run-specific log for '{log_path}': {e}", exc_info=True)
             finally: self.current_run_file_handler = None
         else: logger_app.debug("No active run-specific log handler to close.")
 
     def _update_gui_for_processing_state(self, is_processing):
-        logger_app.debug(f"Updating GUI for processing state: {is_processing}")
-        can_run_now = (self.source_file_path is not None) and (self.button_group.checkedButton() is not None)
-        self.run_btn.setEnabled(not is_processing and can_run_now)
-        self.run_btn.setText("Processing..." if is_processing else "Run")
-        self.rst_btn.setEnabled(not is_processing)
-        self.src_btn.setEnabled(not is_processing and (self.button_group.checkedButton() is not None))
-        for btn in self.button_group.buttons(): btn.setEnabled(not is_processing)
-        self.mdl_combo.setEnabled(not is_processing)
+        logger_app.debug("Updating GUI for processing state: %s", is_processing)
+        has_op = self.button_group.checkedButton() is not None
+        can_run_now = (self.source_file_path is not None) and has_op
+        if self._last_processing_state == is_processing:
+            # No transition: only the selection-dependent buttons can be stale (e.g. after reset_form)
+            self.run_btn.setEnabled(not is_processing and can_run_now); self.src_btn.setEnabled(not is_processing and has_op)
+            return
+        self._last_processing_state = is_processing
+        self.setUpdatesEnabled(False) # One repaint for the whole batch of enable/disable changes
+        try:
+            self.run_btn.setEnabled(not is_processing and can_run_now)
+            self.run_btn.setText("Processing..." if is_processing else "Run")
+            self.rst_btn.setEnabled(not is_processing)
+            self.src_btn.setEnabled(not is_processing and has_op)
+            self.ops_box.setEnabled(not is_processing) # Children inherit the state: one change instead of one per radio button
+            self.mdl_gb.setEnabled(not is_processing)
+        finally: self.setUpdatesEnabled(True)
         if is_processing:
             if not self.processing_dialog: self.processing_dialog = ProcessingIndicatorDialog(self); self.processing_dialog.kill_process_requested.connect(self._confirm_kill_process)
             if not self.processing_dialog.isVisible(): self.processing_dialog.start_animation()
@@ -1484,20 +1987,20 @@ class WhisperCreepInterface(QMainWindow):
             cc.setChecked(False)
             self.button_group.setExclusive(True)
         
-        # Reset UI elements
-        self.src_btn.setEnabled(False)
+        # Reset UI elements (enabled states are set by _update_gui_for_processing_state below)
         self.src_btn.setText("Browse Source File")
         self.src_file_lbl.setText("No file selected.")
         self.mdl_combo.setCurrentText("base")
+        self.backend_combo.setCurrentText(DEFAULT_WHISPER_BACKEND)
+        self.precision_combo.setCurrentText("auto")
+        self.decoding_combo.setCurrentText(DEFAULT_DECODING)
         self._update_gui_for_processing_state(False)
-        self._update_run_button_state()
         
         # Resume any paused monitoring
-        for widget in QApplication.topLevelWidgets():
-            if isinstance(widget, MonitorFolderDialog) and widget.monitoring:
-                logger_app.info("Form cleared, resuming monitoring...")
-                widget.log_event("Monitoring resumed after form clear")
-                widget.tray_icon.setToolTip("WhisperCreep Monitor - Active")
+        for widget in MonitorFolderDialog.active_monitors():
+            logger_app.info("Form cleared, resuming monitoring...")
+            widget.log_event("Monitoring resumed after form clear")
+            widget.tray_icon.setToolTip("WhisperCreep Monitor - Active")
         
         logger_app.info("Form reset OK.")
     def enable_file_buttons(self): 
@@ -1506,27 +2009,23 @@ class WhisperCreepInterface(QMainWindow):
         self._update_run_button_state()
         
         # Check if monitoring is active and show warning if transcription is selected
-        for widget in QApplication.topLevelWidgets():
-            if isinstance(widget, MonitorFolderDialog) and widget.monitoring:
-                sel_op_btn = self.button_group.checkedButton()
-                if sel_op_btn and sel_op_btn.objectName() in ["video_transcript", "audio_transcript"]:
-                    QMessageBox.information(self, "Monitoring Active",
-                        "Note: Starting a transcription will pause the folder monitoring.\n\n"
-                        "The monitoring will automatically resume after your transcription is complete, "
-                        "plus the scheduled monitoring interval.\n\n"
-                        "You can continue with your transcription or stop the monitoring first.")
-                    return
+        for widget in MonitorFolderDialog.active_monitors():
+            sel_op_btn = self.button_group.checkedButton()
+            if sel_op_btn and sel_op_btn.objectName() in ["video_transcript", "audio_transcript"]:
+                QMessageBox.information(self, "Monitoring Active",
+                    "Note: Starting a transcription will pause the folder monitoring.\n\n"
+                    "The monitoring will automatically resume after your transcription is complete, "
+                    "plus the scheduled monitoring interval.\n\n"
+                    "You can continue with your transcription or stop the monitoring first.")
+                return
     def browse_source_file(self): 
-        logger_app.debug("Browse source."); sel_op_btn=self.button_group.checkedButton(); filt="All (*)"
-        if sel_op_btn:
-            nm=sel_op_btn.objectName()
-            if nm=="video_transcript" or nm=="rip_audio": filt="Video (*.mp4 *.mov *.avi *.wmv *.mkv);;All (*)"
-            elif nm=="audio_transcript": filt="Audio (*.mp3 *.wav *.m4a);;All (*)"
-        f_path_tuple=QFileDialog.getOpenFileName(self,"Select Source",os.path.expanduser("~"),filt); f_path=f_path_tuple[0]
+        logger_app.debug("Browse source."); sel_op_btn=self.button_group.checkedButton()
+        filt=self._FILE_FILTERS.get(sel_op_btn.objectName(), "All (*)") if sel_op_btn else "All (*)"
+        f_path_tuple=QFileDialog.getOpenFileName(self,"Select Source",HOME_DIR,filt); f_path=f_path_tuple[0]
         if f_path:
-            self.source_file_path=f_path; btn_txt=f"Src: {os.path.basename(f_path)}"
-            self.src_btn.setText(btn_txt if len(btn_txt)<35 else f"Src: ...{os.path.basename(f_path)[-30:]}")
-            self.src_file_lbl.setText(f"{os.path.basename(f_path)}"); logger_app.info(f"Src file: {f_path}")
+            self.source_file_path=f_path; f_name=QFileInfo(f_path).fileName(); btn_txt=f"Src: {f_name}"
+            self.src_btn.setText(btn_txt if len(btn_txt)<35 else f"Src: ...{f_name[-30:]}")
+            self.src_file_lbl.setText(f_name); logger_app.info("Src file: %s", f_path)
         else:
             if not self.source_file_path: self.src_btn.setText("Browse Source File"); self.src_file_lbl.setText("No file selected.")
             logger_app.debug("Src selection cancelled.")
@@ -1538,14 +2037,14 @@ class WhisperCreepInterface(QMainWindow):
             logger_app.error("Cannot generate output paths: operation or source file missing.")
             return None, None
         op_nm = sel_op_btn.objectName()
-        src_base_no_ext = os.path.splitext(os.path.basename(self.source_file_path))[0]
+        src_base_no_ext = QFileInfo(self.source_file_path).completeBaseName() # Name minus the last extension, like splitext
         
         dloads_dir = get_download_folder_path() # This now has more robust error handling
         if not dloads_dir: 
             # get_download_folder_path will log critical errors.
             # A QMessageBox is shown here to inform the user directly if path generation fails at this stage.
-            QMessageBox.critical(self, "Directory Error", "Could not determine or create the Downloads folder. Please check logs and permissions. Cannot proceed.")
-            logger_app.critical("Failed to get a valid Downloads directory path. Output paths cannot be generated.")
+            self._alert("critical", "Directory Error", "Could not determine or create the Downloads folder. Please check logs and permissions. Cannot proceed.",
+                        log_text="Failed to get a valid Downloads directory path. Output paths cannot be generated.")
             return None, None 
             
         ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1556,15 +2055,15 @@ class WhisperCreepInterface(QMainWindow):
         elif op_nm=="rip_audio": f_stem+=f"_rip_{ts}"; prod_ext=".mp3"
         elif op_nm=="audio_transcript": f_stem+=f"_transcript_{ts}"; prod_ext=".txt"
         else: 
-            logger_app.error(f"Unknown operation name '{op_nm}' for generating output paths.")
-            QMessageBox.critical(self, "Internal Error", f"Unknown operation '{op_nm}' selected. Cannot determine output filenames.")
+            self._alert("error", "Internal Error", f"Unknown operation '{op_nm}' selected. Cannot determine output filenames.",
+                        log_text=f"Unknown operation name '{op_nm}' for generating output paths.")
             return None, None
         
         prod_path = os.path.join(dloads_dir, f_stem + prod_ext)
         log_path = os.path.join(dloads_dir, f_stem + log_suffix)
         
-        logger_app.info(f"Generated production output path: {prod_path}")
-        logger_app.info(f"Generated debug log path for this run: {log_path}")
+        logger_app.info("Generated production output path: %s", prod_path)
+        logger_app.info("Generated debug log path for this run: %s", log_path)
         return prod_path, log_path
 
     def _confirm_kill_process(self): 
@@ -1579,7 +2078,7 @@ class WhisperCreepInterface(QMainWindow):
     def change_app_icon(self):
         """
         Allows user to select a custom icon for the application.
-        Copies the selected icon to the application directory and updates config.ini.
+        Copies the selected icon to the application directory and records it in the app settings.
         """
         logger_app.info("Opening dialog to change app icon")
         
@@ -1587,7 +2086,7 @@ class WhisperCreepInterface(QMainWindow):
         icon_path, _ = QFileDialog.getOpenFileName(
             self, 
             "Select Application Icon", 
-            os.path.expanduser("~"),
+            HOME_DIR,
             "Icon Files (*.ico *.png)"
         )
         
@@ -1596,47 +2095,32 @@ class WhisperCreepInterface(QMainWindow):
             return
             
         try:
-            # Create app config directory if it doesn't exist
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            config_path = os.path.join(script_dir, "config.ini")
-            
             # Copy the selected icon to our directory with a standard name
             icon_filename = "custom_app_icon" + os.path.splitext(icon_path)[1]
-            destination_path = os.path.join(script_dir, icon_filename)
-            
-            # Copy the icon file
-            shutil.copy2(icon_path, destination_path)
-            logger_app.info(f"Copied icon from {icon_path} to {destination_path}")
-            
-            # Update config file
-            config = configparser.ConfigParser()
+            destination_path = os.path.join(SCRIPT_DIR, icon_filename)
             
-            # Load existing config if it exists
-            if os.path.exists(config_path):
-                config.read(config_path)
-                
-            # Ensure we have the UI section
-            if not config.has_section('UI'):
-                config.add_section('UI')
-                
-            # Set the icon path relative to the script directory
-            config.set('UI', 'icon_path', icon_filename)
+            # Copy the icon file next to its final name, then swap it in atomically (a crash never leaves a half-written icon)
+            temp_destination = destination_path + ".tmp"
+            shutil.copyfile(icon_path, temp_destination) # Contents only; an icon needs no copied timestamps or permissions
+            os.replace(temp_destination, destination_path)
+            logger_app.info("Copied icon from %s to %s", icon_path, destination_path)
             
-            # Save the config
-            with open(config_path, 'w') as config_file:
-                config.write(config_file)
-                
-            logger_app.info(f"Updated config file at {config_path}")
+            # Store the icon path relative to the script directory (only when it changed)
+            if _SETTINGS.value("ui/icon_path", "", str) != icon_filename:
+                _SETTINGS.setValue("ui/icon_path", icon_filename)
+                logger_app.info("Saved icon setting: %s", icon_filename)
             
             # Try to apply the icon immediately
             icon = QIcon(destination_path)
             if not icon.isNull():
+                global APP_QICON
+                APP_QICON = icon # Windows/trays created from now on pick up the new icon
                 self.setWindowIcon(icon)
                 app = QApplication.instance()
                 app.setWindowIcon(icon)
                 
-                # Update tray icon too
-                self.tray_icon.setIcon(icon)
+                # Update tray icon too (its menu is left as is)
+                if self.tray_icon: self.tray_icon.setIcon(icon)
                 
                 logger_app.info("Successfully applied new icon to application")
                 QMessageBox.information(
@@ -1663,55 +2147,9 @@ if __name__ == "__main__":
     # Tell Qt to use the system's dark theme if available
     app = QApplication(sys.argv)
     app.setAttribute(Qt.ApplicationAttribute.AA_UseStyleSheetPropagationInWidgetStyles, True)
+    app.setWindowIcon(app_icon()) # Load the icon once; the main window, trays and dialogs reuse it
     
-    # Set up Windows dark title bar if possible
-    if os.name == 'nt':
-        try:
-            # Use ctypes to access Windows API
-            import ctypes
-            
-            # Try to enable dark mode for title bar
-            DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-            hwnd = ctypes.windll.user32.GetActiveWindow()
-            
-            # Enable dark mode for the app
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                hwnd, 
-                DWMWA_USE_IMMERSIVE_DARK_MODE,
-                ctypes.byref(ctypes.c_int(1)),
-                ctypes.sizeof(ctypes.c_int)
-            )
-            logger_app.info("Windows dark mode for title bar enabled")
-        except Exception as e:
-            logger_app.warning(f"Could not enable Windows dark mode for title bar: {e}")
-    
-    window = WhisperCreepInterface()
-    
-    # Apply dark mode to window after creation
-    if os.name == 'nt':
-        try:
-            # Apply dark mode to title bar and window frame
-            hwnd = window.winId()
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                int(hwnd), 
-                DWMWA_USE_IMMERSIVE_DARK_MODE,
-                ctypes.byref(ctypes.c_int(1)),
-                ctypes.sizeof(ctypes.c_int)
-            )
-            
-            # Additional Windows-specific style adjustments to ensure full dark mode
-            # Use GetSystemParametersInfo to get system colors to match system theme perfectly
-            window.setStyleSheet(window.styleSheet() + """
-                QMainWindow {
-                    border: none;
-                }
-            """)
-            
-            # Force a style update
-            window.setStyle(window.style())
-        except Exception as e:
-            logger_app.warning(f"Could not apply dark mode to window: {e}")
-    
+    window = WhisperCreepInterface() # Dark title bar is applied in its first showEvent
     window.show()
     logger_app.info("App window shown. Entering main event loop.")
     sys.exit(app.exec())
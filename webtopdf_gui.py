@@ -1,17 +1,54 @@
+import asyncio
+import hashlib
 import os
+import re
 import sys
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QLineEdit,
     QPushButton, QProgressBar, QMessageBox
 )
 from PySide6.QtCore import Qt, QTimer, Signal, QObject
 from PySide6.QtGui import QPalette, QColor
-from playwright.sync_api import sync_playwright, Playwright
-import time
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+ESTIMATE_WORKERS = 8 # Concurrent GETs per BFS wave while estimating crawl size
+ESTIMATE_MAX_PAGE_BYTES = 2 * 1024 * 1024 # Read at most this much of each HTML page for link discovery
+# Pages rendered to PDF at once in the shared scrape context; each tab lays out/prints in its own Chromium renderer process
+SCRAPE_CONCURRENCY = min(8, max(2, (os.cpu_count() or 4) // 2))
+SCRAPE_BLOCKED_RESOURCES = frozenset({'image', 'media', 'font'}) # Not fetched while scraping; stylesheets are kept for layout
+EXCLUDED_LANGS = frozenset({'zh-Hans', 'zh-Hant', 'ja-JP', 'ko-KR', 'es-ES', 'fr-FR', 'de-DE'}) # <html lang> values we skip
+_EXCLUDED_LANG_RE = re.compile(r'/(?:zh-Hans|zh-Hant|ja-JP|ko-KR|es-ES|fr-FR|de-DE)/') # ...and their URL path segments
+_PAGE_LANG_JS = "() => document.documentElement.lang || ''" # One CDP round-trip, no selector lookup
+_PAGE_LINKS_JS = "() => Array.from(document.querySelectorAll('a[href]'), a => a.href)"
+_ANCHOR_STRAINER = SoupStrainer('a', href=True) # Estimation only needs links, so skip building the rest of the DOM
+try:
+    import lxml # noqa: F401  (C parser, much faster than html.parser)
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+class _FilenameTable(dict):
+    """str.translate table for sanitize_filename: keeps alphanumerics and '-_.', maps everything else to '_'.
+    Entries are filled in (and cached) the first time a code point is seen."""
+    def __missing__(self, code):
+        ch = chr(code); self[code] = value = ch if ch.isalnum() or ch in '-_.' else '_'
+        return value
+
+_FILENAME_TABLE = _FilenameTable()
+
+async def _skip_heavy_resources(route):
+    """Playwright route handler: abort SCRAPE_BLOCKED_RESOURCES requests, let everything else through."""
+    if route.request.resource_type in SCRAPE_BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 # Define a QObject to emit signals across threads
 class ScraperSignals(QObject):
@@ -84,9 +121,16 @@ class WebToPDFScraper(QWidget):
         self.output_dir = os.path.join(os.path.expanduser("~"), "Downloads", "WebContentScaper")
         os.makedirs(self.output_dir, exist_ok=True)
         self.log_path = os.path.join(self.output_dir, "last_run_log.txt")
+        self._done_path = self.log_path + ".done" # URLs finished so far, appended one per page; log_path itself is written once
+
+        # One keep-alive session for all estimation/security requests; the pool covers every estimation worker
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=ESTIMATE_WORKERS, pool_maxsize=ESTIMATE_WORKERS * 4, max_retries=0)
+        self._http.mount('https://', adapter); self._http.mount('http://', adapter)
 
         # Playwright will be initialized and stopped within the dedicated thread
         self.pw_thread = None
+        self._login_done = threading.Event() # Set by the manual-login dialog once the user clicks OK
 
     def closeEvent(self, event):
         # Ensure Playwright thread is stopped if running
@@ -96,6 +140,7 @@ class WebToPDFScraper(QWidget):
             self.pw_thread.join(timeout=2) # Give it a moment to finish
             if self.pw_thread.is_alive():
                 print("Playwright thread did not terminate.")
+        self._http.close()
         super().closeEvent(event)
 
     def set_dark_theme(self):
@@ -158,7 +203,7 @@ class WebToPDFScraper(QWidget):
             return False, "URL is not HTTPS. For 2FA and secure login, HTTPS is required."
 
         try:
-            response = requests.head(url, timeout=10, allow_redirects=True)
+            response = self._http.head(url, timeout=10, allow_redirects=True)
             response.raise_for_status()
 
             if not response.url.startswith('https://'):
@@ -188,62 +233,83 @@ class WebToPDFScraper(QWidget):
         page_count, total_bytes, pages = self.estimate_crawl_size_requests(root_url)
         self.signals.estimation_complete.emit(page_count, total_bytes, pages)
 
+    def _fetch_page(self, url):
+        """Fetch one URL for estimation; returns (url, byte count, raw html bytes or None, header charset or None). Runs on a pool thread.
+        Bodies are streamed: non-HTML is sized from Content-Length without downloading, HTML is capped at ESTIMATE_MAX_PAGE_BYTES."""
+        try:
+            with self._http.get(url, timeout=10, stream=True) as response:
+                length = response.headers.get('Content-Length', '')
+                length = int(length) if length.isdigit() else 0
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and 'html' not in content_type:
+                    return url, length, None, None
+                # Only trust an explicit charset; otherwise let the parser sniff <meta charset> from the bytes
+                encoding = response.encoding if 'charset=' in content_type.lower() else None
+                body = bytearray()
+                for chunk in response.iter_content(65536):
+                    body += chunk
+                    if len(body) >= ESTIMATE_MAX_PAGE_BYTES:
+                        break
+                return url, max(length, len(body)), bytes(body), encoding
+        except requests.exceptions.RequestException as e:
+            print(f"Request failed for {url}: {e}")
+            return url, 0, None, None
+
     def estimate_crawl_size_requests(self, root_url):
-        visited = set()
-        queue = [root_url]
+        # Breadth-first, one wave (BFS level) at a time: every page in a wave is fetched concurrently.
+        # URLs are marked seen when enqueued, so nothing is queued (or fetched) twice.
         total_bytes = 0
         page_count = 0
         all_pages = []
 
-        root_domain = urlparse(root_url).netloc
-        excluded_langs = ['/zh-Hans/', '/zh-Hant/', '/ja-JP/', '/ko-KR/', '/es-ES/', '/fr-FR/', '/de-DE/']
-
-        while queue:
-            url = queue.pop(0)
-            parsed_url = urlparse(url)
-
-            if url in visited or parsed_url.netloc != root_domain:
-                continue
-
-            if '/en/' not in parsed_url.path:
-                 if any(lang_path in parsed_url.path for lang_path in excluded_langs):
-                     continue
-
-            visited.add(url)
-            all_pages.append(url)
-            page_count += 1
-
-            try:
-                response = requests.get(url, timeout=10)
-                total_bytes += len(response.content)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                for link in soup.find_all('a', href=True):
-                    next_url = urljoin(url, link['href'])
-                    parsed_next_url = urlparse(next_url)
-
-                    if parsed_next_url.netloc == root_domain and next_url not in visited:
-                        if '/en/' not in parsed_next_url.path:
-                            if any(lang_path in parsed_next_url.path for lang_path in excluded_langs):
-                                continue
-                        queue.append(next_url)
-            except requests.exceptions.RequestException as e:
-                print(f"Request failed for {url}: {e}")
-                continue
-            except Exception as e:
-                print(f"Error processing {url}: {e}")
-                continue
+        parsed_root = urlparse(root_url) # Each URL is parsed exactly once, when it is first discovered
+        root_domain, root_path = parsed_root.netloc, parsed_root.path
+        seen = {root_url}
+        frontier = [] if '/en/' not in root_path and _EXCLUDED_LANG_RE.search(root_path) else [root_url]
+
+        with ThreadPoolExecutor(max_workers=ESTIMATE_WORKERS) as pool:
+            while frontier:
+                wave, frontier = frontier, []
+                all_pages.extend(wave)
+                page_count += len(wave)
+                for url, page_bytes, html, encoding in pool.map(self._fetch_page, wave):
+                    total_bytes += page_bytes
+                    if html is None:
+                        continue
+                    try:
+                        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_ANCHOR_STRAINER, from_encoding=encoding)
+                        for link in soup.find_all('a', href=True):
+                            next_url = urljoin(url, link['href'])
+                            parsed_next_url = urlparse(next_url)
+
+                            if parsed_next_url.netloc == root_domain and next_url not in seen:
+                                if '/en/' not in parsed_next_url.path and _EXCLUDED_LANG_RE.search(parsed_next_url.path):
+                                    continue
+                                seen.add(next_url)
+                                frontier.append(next_url)
+                    except Exception as e:
+                        print(f"Error processing {url}: {e}")
+                        continue
         return page_count, total_bytes, all_pages
 
     def prompt_to_continue(self, page_count, total_bytes, pages):
         self.pages_to_scrape = pages
         self.status_label.setText(f"Estimated: {page_count} pages, {total_bytes // 1024} KB")
-        reply = QMessageBox.question(self, "Confirm",
-                                     f"Estimated: {page_count} pages, {total_bytes // 1024} KB\nDo you want to continue?",
-                                     QMessageBox.Yes | QMessageBox.No)
-        if reply == QMessageBox.Yes:
+        # Window-modal but non-blocking: the event loop (and the busy progress bar) keeps running while the user decides
+        box = QMessageBox(QMessageBox.Question, "Confirm",
+                          f"Estimated: {page_count} pages, {total_bytes // 1024} KB\nDo you want to continue?",
+                          QMessageBox.Yes | QMessageBox.No, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(lambda _result: self._on_continue_reply(box.clickedButton() is not None and box.standardButton(box.clickedButton()) == QMessageBox.Yes))
+        box.open()
+
+    def _on_continue_reply(self, accepted):
+        if accepted:
             with open(self.log_path, 'w', encoding='utf-8') as f:
                 for url in self.pages_to_scrape:
                     f.write(url + '\n')
+            if os.path.exists(self._done_path):
+                os.remove(self._done_path) # A fresh page list starts with nothing done
 
             # Emit signal to start the Playwright process in its dedicated thread
             self.signals.start_playwright_process.emit(self.root_url, self.pages_to_scrape)
@@ -253,55 +319,57 @@ class WebToPDFScraper(QWidget):
             self.progress_bar.setRange(0, 1)
 
     def _run_playwright_process_thread(self, root_url, pages_to_scrape):
-        # This method runs in a dedicated thread to handle all Playwright operations
-        self.pw_thread = threading.current_thread()
-        pw_sync_api = None
-        pw_browser = None
-        pw_context = None
+        # Slot runs on the GUI thread; hand the whole Playwright session to a dedicated thread with its own asyncio loop
+        self.pw_thread = threading.Thread(target=self._playwright_process, args=(root_url, pages_to_scrape), daemon=True)
+        self.pw_thread.start()
 
+    def _playwright_process(self, root_url, pages_to_scrape):
         try:
-            pw_sync_api = sync_playwright().start()
-            # Launch browser in headless mode for scraping, non-headless for manual login
-            pw_browser = pw_sync_api.chromium.launch(headless=False) # Keep non-headless for initial login
-            pw_context = pw_browser.new_context()
-
-            # Initiate manual login within this thread
-            self._initiate_manual_login_playwright(root_url, pw_context)
-
-            # After manual login, proceed with scraping within this thread
-            # Re-launch browser in headless mode for scraping
-            pw_browser.close() # Close the non-headless browser used for login
-            pw_browser = pw_sync_api.chromium.launch(headless=True) # Launch headless browser for scraping
-            pw_context = pw_browser.new_context() # Create a new context with the headless browser
-
-            self._run_scraper_playwright(root_url, pages_to_scrape, pw_context)
-
+            asyncio.run(self._playwright_process_async(root_url, pages_to_scrape))
         except Exception as e:
             self.signals.scrape_error.emit(f"Playwright process failed: {e}")
         finally:
-            if pw_browser:
-                pw_browser.close()
-            if pw_sync_api:
-                pw_sync_api.stop()
             self.signals.scrape_complete.emit()
 
-
-    def _initiate_manual_login_playwright(self, url, pw_context):
+    async def _playwright_process_async(self, root_url, pages_to_scrape):
+        async with async_playwright() as pw:
+            # Non-headless browser for manual login, headless for scraping (page.pdf() only works headless).
+            # One driver serves both, and the headless browser cold-starts in the background while the user logs in.
+            scrape_launch = asyncio.ensure_future(pw.chromium.launch(headless=True))
+            login_browser = None
+            try:
+                login_browser = await pw.chromium.launch(headless=False)
+                pw_context = await login_browser.new_context()
+                await self._initiate_manual_login_playwright(root_url, pw_context)
+
+                # Carry the logged-in cookies/storage over into the scrape context
+                login_state = await pw_context.storage_state()
+                await login_browser.close() # Close the non-headless browser used for login
+                scrape_browser = await scrape_launch
+                pw_context = await scrape_browser.new_context(storage_state=login_state)
+                await pw_context.route('**/*', _skip_heavy_resources)
+
+                await self._run_scraper_playwright(root_url, pages_to_scrape, pw_context)
+            finally:
+                if login_browser:
+                    await login_browser.close()
+                try:
+                    await (await scrape_launch).close()
+                except Exception:
+                    pass # Launch itself failed; nothing to close
+
+
+    async def _initiate_manual_login_playwright(self, url, pw_context):
         try:
-            page = pw_context.new_page()
-            page.goto(url, timeout=60000)
+            page = await pw_context.new_page()
+            await page.goto(url, timeout=60000)
 
-            # Emit signal to show manual login dialog on the main thread
+            # Emit signal to show manual login dialog on the main thread, then wait until the user dismisses it
+            self._login_done.clear()
             self.signals.manual_login_prompt.emit(url)
+            await asyncio.to_thread(self._login_done.wait, 600)
 
-            # Wait for the user to signal completion from the main thread (via the dialog)
-            # This requires a way to signal back from the main thread after the dialog is closed.
-            # For simplicity here, we'll just add a small delay. A real app needs a proper signal/slot mechanism.
-            # A better approach would be a signal from the main thread's dialog handler back to this thread.
-            # For now, let's assume the user interacts and the browser is ready after a delay.
-            time.sleep(5) # Placeholder: Replace with a signal-based wait
-
-            page.close()
+            await page.close()
 
         except Exception as e:
             raise Exception(f"Failed to open browser for manual login: {e}")
@@ -311,75 +379,64 @@ class WebToPDFScraper(QWidget):
         QMessageBox.information(self, "Manual Login Required",
                                 f"A browser window has opened. Please log in to '{url}' manually in that window. "
                                 "Click OK here when you are fully logged in and ready for the script to continue scraping.")
-        # In a real app, after this dialog closes, emit a signal back to the Playwright thread to continue.
-        # For this simplified example, the Playwright thread will continue after a delay (see _initiate_manual_login_playwright)
+        self._login_done.set() # Releases the Playwright thread (see _initiate_manual_login_playwright)
 
 
-    def _run_scraper_playwright(self, root_url, pages_to_scrape, pw_context):
-        visited = set()
+    async def _run_scraper_playwright(self, root_url, pages_to_scrape, pw_context):
         if os.path.exists(self.log_path):
             try:
                 with open(self.log_path, 'r', encoding='utf-8') as f:
-                    remaining_urls = [line.strip() for line in f if line.strip()]
+                    remaining_urls = {line.strip() for line in f if line.strip()} # Set: O(1) lookups in the filter below
+                if os.path.exists(self._done_path):
+                    with open(self._done_path, 'r', encoding='utf-8') as f:
+                        finished_urls = {line.strip() for line in f}
+                    remaining_urls -= finished_urls
                 pages_to_scrape = [url for url in pages_to_scrape if url in remaining_urls]
             except Exception as e:
                 print(f"Error reading log file: {e}")
 
-        # Filter out non-English pages using Playwright before starting the scrape
-        self.signals.update_status_label.emit("Filtering non-English pages with Playwright...")
-        print("Filtering non-English pages with Playwright...")
-        filtered_pages_to_scrape = []
-        excluded_langs = ['zh-Hans', 'zh-Hant', 'ja-JP', 'ko-KR', 'es-ES', 'fr-FR', 'de-DE']
-
-        for url in pages_to_scrape:
-            try:
-                page = pw_context.new_page()
-                page.goto(url, timeout=30000)
-                page_lang = page.eval_on_selector('html', 'element => element.lang') or ''
-                page.close()
-                if page_lang not in excluded_langs:
-                    filtered_pages_to_scrape.append(url)
-                else:
-                    print(f"Filtered out {url} due to language: {page_lang}")
-            except Exception as e:
-                print(f"Failed to check language for {url}: {e}")
-                # Optionally include the page if language check fails, or skip it.
-                # For now, we'll skip it to be safe.
-
-        pages_to_scrape = filtered_pages_to_scrape
-        self.signals.update_status_label.emit(f"Scraping {len(pages_to_scrape)} English pages...")
-        print(f"Scraping {len(pages_to_scrape)} English pages...")
-
-        self.signals.set_progress_bar_range.emit(0, len(pages_to_scrape))
-        self.signals.progress_update.emit(0, len(pages_to_scrape))
-
+        pages_to_scrape = list(dict.fromkeys(pages_to_scrape)) # Drop duplicates, keep order
+        total = len(pages_to_scrape)
+        # Non-English pages are skipped inside _save_pdf_playwright, on the same load that renders the PDF
+        self.signals.update_status_label.emit(f"Scraping {total} pages...")
+        print(f"Scraping {total} pages...")
+
+        self.signals.set_progress_bar_range.emit(0, total)
+        self.signals.progress_update.emit(0, total)
+
+        # Up to SCRAPE_CONCURRENCY pages load and print at once, each in its own tab of the shared context
+        sem = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+        done = set()
+        progress_step = max(1, total // 100) # Update the progress bar at most ~100 times per run
+
+        async def save_one(index, url):
+            async with sem:
+                saved = await self._save_pdf_playwright(url, index, pw_context)
+            done.add(url)
+            if len(done) == total or len(done) % progress_step == 0:
+                self.signals.progress_update.emit(len(done), total)
+            if saved:
+                done_log.write(url + '\n'); done_log.flush() # Checkpoint only real saves, so a resume retries failed pages
 
         try:
-            for index, url in enumerate(pages_to_scrape):
-                if url in visited:
-                    continue
-                visited.add(url)
-                self._save_pdf_sync_playwright(url, index, pw_context)
-                with open(self.log_path, 'w', encoding='utf-8') as f:
-                    for remaining_url in pages_to_scrape[index+1:]:
-                        f.write(remaining_url + '\n')
+            with open(self._done_path, 'a', encoding='utf-8') as done_log:
+                await asyncio.gather(*(save_one(index, url) for index, url in enumerate(pages_to_scrape)))
         except Exception as e:
             raise Exception(f"Scraping failed: {e}")
 
 
-    def estimate_crawl_size_playwright(self, root_url, initial_page, pw_context):
+    async def estimate_crawl_size_playwright(self, root_url, initial_page, pw_context):
         visited = set()
-        queue = [root_url]
+        queue = deque([root_url])
         all_pages = []
         root_domain = urlparse(root_url).netloc
-        excluded_langs = ['zh-Hans', 'zh-Hant', 'ja-JP', 'ko-KR', 'es-ES', 'fr-FR', 'de-DE'] # Check lang attribute
 
         # Check language of the initial page
-        initial_page_lang = initial_page.eval_on_selector('html', 'element => element.lang') or ''
-        if initial_page_lang not in excluded_langs:
+        initial_page_lang = await initial_page.evaluate(_PAGE_LANG_JS)
+        if initial_page_lang not in EXCLUDED_LANGS:
             visited.add(root_url)
             all_pages.append(root_url)
-            links_on_initial_page = initial_page.eval_on_selector_all('a[href]', 'elements => elements.map(e => e.href)')
+            links_on_initial_page = await initial_page.evaluate(_PAGE_LINKS_JS)
             for link in links_on_initial_page:
                 next_url = urljoin(root_url, link)
                 parsed_next_url = urlparse(next_url)
@@ -389,23 +446,23 @@ class WebToPDFScraper(QWidget):
 
 
         while queue:
-            url = queue.pop(0)
+            url = queue.popleft()
 
             try:
-                page = pw_context.new_page()
-                page.goto(url, wait_until="networkidle", timeout=30000)
+                page = await pw_context.new_page()
+                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
 
-                page_lang = page.eval_on_selector('html', 'element => element.lang') or ''
-                if page_lang not in excluded_langs:
+                page_lang = await page.evaluate(_PAGE_LANG_JS)
+                if page_lang not in EXCLUDED_LANGS:
                     all_pages.append(url)
-                    links = page.eval_on_selector_all('a[href]', 'elements => elements.map(e => e.href)')
+                    links = await page.evaluate(_PAGE_LINKS_JS)
                     for link in links:
                         next_url = urljoin(url, link)
                         parsed_next_url = urlparse(next_url)
                         if parsed_next_url.netloc == root_domain and next_url not in visited:
                             queue.append(next_url)
                             visited.add(next_url)
-                page.close()
+                await page.close()
 
             except Exception as e:
                 print(f"Playwright crawl failed for {url}: {e}")
@@ -413,34 +470,47 @@ class WebToPDFScraper(QWidget):
         return all_pages
 
 
-    def _save_pdf_sync_playwright(self, url, index, pw_context):
+    async def _save_pdf_playwright(self, url, index, pw_context):
+        """Render url to a PDF; True once the page is handled (saved, or skipped for its language), False if it failed."""
+        page = None
         try:
-            page = pw_context.new_page()
-            page.goto(url, timeout=60000)
+            page = await pw_context.new_page()
+            # Don't wait for every beacon/tracker: DOM ready, then give the load event a short grace period
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            try:
+                await page.wait_for_load_state("load", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
 
-            page_lang = page.eval_on_selector('html', 'element => element.lang') or ''
-            excluded_langs = ['zh-Hans', 'zh-Hant', 'ja-JP', 'ko-KR', 'es-ES', 'fr-FR', 'de-DE']
+            page_lang = await page.evaluate(_PAGE_LANG_JS)
 
-            if page_lang in excluded_langs:
+            if page_lang in EXCLUDED_LANGS:
                 print(f"Skipping {url} due to language: {page_lang}")
-                page.close()
-                self.signals.progress_update.emit(index + 1, len(self.pages_to_scrape))
-                return
+                return True
 
-            filename = self.sanitize_filename(urlparse(url).path or urlparse(url).netloc.replace('.', '_') or "index")
+            parsed_url = urlparse(url)
+            filename = self.sanitize_filename(parsed_url.path or parsed_url.netloc.replace('.', '_') or "index")
             if not filename:
                 filename = f"page_{index}"
 
-            path = os.path.join(self.output_dir, f"{filename}.pdf")
+            # URLs differing only in query/fragment sanitize alike; a short hash of the full URL keeps concurrent tabs off the same file
+            url_hash = hashlib.blake2s(url.encode('utf-8'), digest_size=4).hexdigest()
+            path = os.path.join(self.output_dir, f"{filename}_{url_hash}.pdf")
 
-            page.pdf(path=path, format="A4")
-            page.close()
-            self.signals.progress_update.emit(index + 1, len(self.pages_to_scrape))
+            await page.pdf(path=path, format="A4")
+            return True
         except Exception as e:
             print(f"PDF Save Failed for {url}: {e}")
+            return False
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass # Context already gone; nothing left to free
 
     def sanitize_filename(self, name):
-        return "".join(c if c.isalnum() or c in ('-', '_', '.') else '_' for c in name).strip()
+        return name.translate(_FILENAME_TABLE).strip()
 
     def update_progress(self, current, total):
         self.progress_bar.setValue(current)
@@ -450,8 +520,9 @@ class WebToPDFScraper(QWidget):
         self.progress_bar.setVisible(False)
         self.progress_bar.setRange(0, 1)
         self.status_label.setText("Scraping complete.")
-        if os.path.exists(self.log_path):
-            os.remove(self.log_path)
+        for path in (self.log_path, self._done_path):
+            if os.path.exists(path):
+                os.remove(path)
         QMessageBox.information(self, "Done", "Scraping complete. PDFs saved to Downloads/WebContentScaper.")
 
     def on_scrape_error(self, message):
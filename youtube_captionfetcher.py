@@ -1,6 +1,11 @@
+import codecs
+import functools
 import os
+import re
+import sys
 import subprocess
 import logging
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 import webbrowser
@@ -8,91 +13,110 @@ import webbrowser
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QProgressBar
 )
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QThread, QThreadPool, Signal
+
+# One SRT cue: index line, "HH:MM:SS,mmm --> HH:MM:SS,mmm" line (groups 1-8), then one or more non-blank text lines (group 9)
+_CUE_RE = re.compile(
+    r'^[ \t]*\d+[ \t]*\n'
+    r'[ \t]*(\d+):(\d{2}):(\d{2}),(\d{3}) --> (\d+):(\d{2}):(\d{2}),(\d{3})[^\n]*\n'
+    r'((?:[ \t]*\S[^\n]*(?:\n|\Z))+)',
+    re.MULTILINE)
+_WS_RE = re.compile(r'\s+') # Cue text is compared whitespace-normalised
+_PROGRESS_TEMPLATE = "download:ytprogress %(progress.downloaded_bytes)s/%(progress.total_bytes,progress.total_bytes_estimate)s"
+_PROGRESS_RE = re.compile(r'^ytprogress (\d+)/(\d+)') # Lines printed via _PROGRESS_TEMPLATE (totals can be NA, which won't match)
+
+def _iter_srt_blocks(srt_path, chunk_size=65536):
+    """Yield an SRT file as decoded, LF-normalised text blocks that always end on a cue boundary (blank line).
+    Reads chunk_size bytes at a time, so memory stays bounded however long the captions are."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    with open(srt_path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            pending += decoder.decode(chunk, final=not chunk)
+            if "\r" in pending:
+                pending = pending.replace("\r\n", "\n") # A lone trailing \r waits for its \n in the next chunk
+            if not chunk:
+                if pending:
+                    yield pending
+                return
+            cut = pending.rfind("\n\n") + 1
+            if cut:
+                yield pending[:cut]
+                pending = pending[cut:]
+
+@functools.cache
+def _find_yt_dlp():
+    """Path of yt-dlp.exe, probed once per process; raises FileNotFoundError (not cached) if it isn't installed."""
+    candidates = (os.path.join(sys.exec_prefix, "Scripts", "yt-dlp.exe"),
+                  os.path.join(os.environ["USERPROFILE"], "AppData", "Roaming", "Python", "Python312", "Scripts", "yt-dlp.exe"))
+    for path in candidates:
+        if os.path.isfile(path): # One stat per candidate; a directory named yt-dlp.exe doesn't count
+            return path
+    raise FileNotFoundError("yt-dlp.exe not found at expected locations:\n" + "\n".join(candidates) + "\nPlease ensure yt-dlp is installed.")
 
 class YouTubeCaptionWorker(QThread):
     log_signal = Signal(str)
+    progress_signal = Signal(int) # Download percentage, emitted only when it changes
     error_signal = Signal(str)
     done_signal = Signal(str)
 
-    def __init__(self, video_url: str, output_dir: Path):
+    def __init__(self, video_url: str, output_dir: Path, final_output_path: Path, raw_prefix: str):
         super().__init__()
         self.video_url = video_url
         self.output_dir = output_dir
-
-    def parse_timestamp(self, ts):
-        """Parse SRT timestamp to seconds."""
-        h, m, s_ms = ts.split(':')
-        s, ms = s_ms.split(',')
-        seconds = int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000
-        return seconds
+        self.final_output_path = final_output_path # Cleaned captions land here
+        self.raw_prefix = raw_prefix # Unique file-name stem for yt-dlp's raw download
 
     def clean_srt_file(self, srt_path, output_path):
+        """Drop cues shorter than 0.5s and repeated cue text; the surviving cues are written out verbatim."""
+        # Cues are read block by block and written as they are accepted; neither file is ever held whole in memory.
+        # They go to a .tmp sibling that is renamed over output_path only once complete, so no half-written output is left behind.
+        tmp_path = output_path.with_suffix(".srt.tmp")
         try:
-            lines = srt_path.read_text(encoding="utf-8").splitlines()
-            cleaned = []
-            seen_text = set()
-            buffer = []
-
-            for line in lines:
-                if line.strip() == "":
-                    if len(buffer) >= 3:
-                        timestamp_line = buffer[1]
-                        start_str, end_str = timestamp_line.split(' --> ')
-                        start_time = self.parse_timestamp(start_str.strip())
-                        end_time = self.parse_timestamp(end_str.strip())
-                        duration = end_time - start_time
-                        if duration >= 0.5:
-                            actual_text_content = "\n".join(text_line.strip() for text_line in buffer[2:]).strip()
-                            if actual_text_content and actual_text_content not in seen_text:
-                                cleaned.extend(buffer)
-                                cleaned.append("")
-                                seen_text.add(actual_text_content)
-                    buffer = []
-                else:
-                    buffer.append(line)
-
-            # Process the last buffer if necessary
-            if len(buffer) >= 3:
-                timestamp_line = buffer[1]
-                start_str, end_str = timestamp_line.split(' --> ')
-                start_time = self.parse_timestamp(start_str.strip())
-                end_time = self.parse_timestamp(end_str.strip())
-                duration = end_time - start_time
-                if duration >= 0.5:
-                    actual_text_content = "\n".join(text_line.strip() for text_line in buffer[2:]).strip()
-                    if actual_text_content and actual_text_content not in seen_text:
-                        cleaned.extend(buffer)
-                        cleaned.append("")
-
-            if cleaned:
-                output_path.write_text("\n".join(cleaned), encoding="utf-8")
-                if srt_path.exists() and srt_path != output_path:
-                    srt_path.unlink()
+            kept = 0
+            seen_text = set() # hash() of each kept cue's text: 8 bytes per cue instead of pinning every string
+
+            with open(tmp_path, "wb") as out:
+                for block in _iter_srt_blocks(srt_path):
+                    for m in _CUE_RE.finditer(block):
+                        sh, sm, ss, sms, eh, em, es, ems = map(int, m.group(1, 2, 3, 4, 5, 6, 7, 8))
+                        duration_ms = (eh - sh) * 3600000 + (em - sm) * 60000 + (es - ss) * 1000 + (ems - sms)
+                        if duration_ms >= 500:
+                            text_key = hash(_WS_RE.sub(" ", m.group(9)).strip())
+                            if text_key not in seen_text:
+                                out.write((("\n\n" if kept else "") + m.group(0).rstrip("\n")).encode("utf-8"))
+                                kept += 1
+                                seen_text.add(text_key)
+                if kept:
+                    out.write(b"\n")
+
+            if kept:
+                os.replace(tmp_path, output_path)
+                if srt_path != output_path:
+                    srt_path.unlink(missing_ok=True)
             else:
                 self.log_signal.emit(f"Warning: Cleaning resulted in an empty caption file from {srt_path.name}. Original not deleted.")
 
         except Exception as e:
             self.error_signal.emit(f"File cleaning/processing failed: {str(e)}\nOriginal SRT was: {srt_path.name if srt_path else 'Unknown'}")
+        finally:
+            try:
+                tmp_path.unlink(missing_ok=True) # Gone already after a successful os.replace; otherwise an empty result or a failure
+            except OSError as e:
+                self.log_signal.emit(f"Warning: could not remove temp file {tmp_path.name}: {e}")
 
     def run(self):
         try:
-            import sys 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            final_cleaned_output_path = self.output_dir / f"YoutubeSubs_{timestamp}.srt"
-
-            yt_dlp_path_str = os.path.join(sys.exec_prefix, "Scripts", "yt-dlp.exe")
-            if not os.path.exists(yt_dlp_path_str):
-                yt_dlp_path_str = os.path.join(os.environ["USERPROFILE"], "AppData", "Roaming", "Python", "Python312", "Scripts", "yt-dlp.exe")
-
-            if not Path(yt_dlp_path_str).exists():
-                self.error_signal.emit(f"yt-dlp.exe not found at expected locations:\n"
-                                       f"{os.path.join(sys.exec_prefix, 'Scripts', 'yt-dlp.exe')}\n"
-                                       f"{os.path.join(os.environ['USERPROFILE'], 'AppData', 'Roaming', 'Python', 'Python312', 'Scripts', 'yt-dlp.exe')}\n"
-                                       f"Please ensure yt-dlp is installed.")
+            final_cleaned_output_path, raw_prefix = self.final_output_path, self.raw_prefix
+            try:
+                yt_dlp_path_str = _find_yt_dlp()
+            except FileNotFoundError as e:
+                self.error_signal.emit(str(e))
                 return
 
-            yt_dlp_output_template = self.output_dir / "%(title)s.%(ext)s"
+            yt_dlp_output_template = self.output_dir / f"{raw_prefix}.%(ext)s"
+            expected_srt_path = self.output_dir / f"{raw_prefix}.en.srt" # The unique prefix makes yt-dlp's subtitle name known up front
 
             cmd = [
                 yt_dlp_path_str,
@@ -100,36 +124,42 @@ class YouTubeCaptionWorker(QThread):
                 "--sub-lang", "en",
                 "--skip-download",
                 "--convert-subs", "srt",
+                "--quiet", "--progress", # No informational chatter to decode; warnings/errors and progress lines still come through
+                "--newline", "--progress-template", _PROGRESS_TEMPLATE, # Machine-readable progress, one line per update
                 "-o", str(yt_dlp_output_template),
                 self.video_url
             ]
 
-            self.log_signal.emit(f"Running command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, errors='replace')
-            self.log_signal.emit(f"STDOUT:\n{result.stdout}")
-            self.log_signal.emit(f"STDERR:\n{result.stderr}")
-
-            if result.returncode != 0:
-                potential_srt_files = sorted(
-                    [f for f in self.output_dir.glob("*.en.srt") if f.is_file()],
-                    key=lambda f: f.stat().st_mtime,
-                    reverse=True
-                )
-                if not potential_srt_files:
-                    self.error_signal.emit(f"yt-dlp failed and no SRT file found. STDERR:\n{result.stderr}")
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                self.log_signal.emit(f"Running command: {subprocess.list2cmdline(cmd)}") # Quoted exactly as Windows will see it
+            # Stream yt-dlp's merged stdout/stderr line by line; only a short tail is kept for the error message
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, errors='replace')
+            output_tail = deque(maxlen=20)
+            last_pct = -1
+            for line in proc.stdout:
+                line = line.rstrip()
+                progress = _PROGRESS_RE.match(line)
+                if progress:
+                    done_bytes, total_bytes = int(progress.group(1)), int(progress.group(2))
+                    pct = min(100, done_bytes * 100 // total_bytes) if total_bytes else 0
+                    if pct != last_pct:
+                        self.progress_signal.emit(pct); last_pct = pct
+                    continue
+                # With --quiet only warnings/errors get here (progress lines are handled above), so log each one as it arrives
+                self.log_signal.emit(line)
+                output_tail.append(line)
+            returncode = proc.wait()
+            downloaded_srt_file_path = expected_srt_path if expected_srt_path.is_file() else None
+
+            if returncode != 0:
+                if downloaded_srt_file_path is None:
+                    self.error_signal.emit("yt-dlp failed and no SRT file found. Output:\n" + "\n".join(output_tail))
                     return
-                downloaded_srt_file_path = potential_srt_files[0]
-                self.log_signal.emit(f"yt-dlp exited with code {result.returncode} but an SRT file '{downloaded_srt_file_path.name}' was found. Attempting to process it.")
+                self.log_signal.emit(f"yt-dlp exited with code {returncode} but an SRT file '{downloaded_srt_file_path.name}' was found. Attempting to process it.")
             else:
-                downloaded_srt_files = sorted(
-                    [f for f in self.output_dir.glob("*.en.srt") if f.is_file()],
-                    key=lambda f: f.stat().st_mtime,
-                    reverse=True
-                )
-                if not downloaded_srt_files:
+                if downloaded_srt_file_path is None:
                     self.error_signal.emit("SRT file not found after successful yt-dlp download.")
                     return
-                downloaded_srt_file_path = downloaded_srt_files[0]
 
             self.log_signal.emit(f"Processing downloaded SRT file: {downloaded_srt_file_path}")
             self.clean_srt_file(downloaded_srt_file_path, final_cleaned_output_path)
@@ -183,12 +213,18 @@ class YouTubeCaptionFetcher(QWidget):
             QMessageBox.warning(self, "Input Error", "Please enter a YouTube URL.")
             return
 
+        self.progress_bar.setRange(0, 0) # Busy until yt-dlp reports real progress (see on_progress)
         self.progress_bar.setVisible(True)
         self.download_button.setEnabled(False)
         self.cancel_button.setEnabled(False) 
 
-        self.worker = YouTubeCaptionWorker(url, self.output_dir)
+        # Output names are fixed here so the worker only runs yt-dlp and cleans. The raw prefix is unique per run,
+        # so the worker's expected "<raw_prefix>.en.srt" can't be a leftover from an earlier run
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        final_output_path = self.output_dir / f"YoutubeSubs_{timestamp}.srt"
+        self.worker = YouTubeCaptionWorker(url, self.output_dir, final_output_path, f"ytcap_{timestamp}_{os.getpid()}")
         self.worker.log_signal.connect(self.log)
+        self.worker.progress_signal.connect(self.on_progress)
         self.worker.error_signal.connect(self.show_error)
         self.worker.done_signal.connect(self.show_success)
         self.worker.finished.connect(self.on_worker_finished)
@@ -205,6 +241,11 @@ class YouTubeCaptionFetcher(QWidget):
         self.cancel_button.setEnabled(True)
         self.log("Worker thread finished signal received.")
 
+    def on_progress(self, pct):
+        if self.progress_bar.maximum() == 0:
+            self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(pct)
+
     def log(self, message):
         print(message) 
         logging.info(message)
@@ -220,30 +261,38 @@ class YouTubeCaptionFetcher(QWidget):
         self.progress_bar.setVisible(False)
         self.download_button.setEnabled(True)
         self.cancel_button.setEnabled(True)
-        QMessageBox.information(self, "Download Complete", f"Captions saved to:\n{filepath}")
         logging.info(f"Download Complete. Captions saved to: {filepath}")
+        # Explorer can take a while to start; open it from a pool thread so the dialog appears straight away
+        QThreadPool.globalInstance().start(self._open_output_dir)
+        QMessageBox.information(self, "Download Complete", f"Captions saved to:\n{filepath}")
+
+    def _open_output_dir(self):
         try:
-            webbrowser.open(self.output_dir.as_uri()) 
+            webbrowser.open(self.output_dir.as_uri())
         except Exception as e:
             self.log(f"Could not open output directory: {e}")
             logging.warning(f"Could not open output directory {self.output_dir.as_uri()}: {e}")
 
 if __name__ == "__main__":
-    import sys
+    import atexit
+    import queue
+    import logging.handlers
     from PySide6.QtWidgets import QApplication
 
     log_dir = Path(os.environ["USERPROFILE"]) / "Downloads"
     log_dir.mkdir(parents=True, exist_ok=True) 
     log_file_path = log_dir / "youtube_caption_downloader.log"
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(threadName)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file_path),
-            logging.StreamHandler(sys.stdout) 
-        ]
-    )
+    # Callers (incl. the GUI thread) only enqueue records; the file/console writes happen on the listener's thread
+    log_queue = queue.SimpleQueue()
+    file_handler = logging.FileHandler(log_file_path)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    log_format = logging.Formatter('%(asctime)s - %(levelname)s - %(threadName)s - %(message)s')
+    file_handler.setFormatter(log_format); stream_handler.setFormatter(log_format)
+    log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
     logging.info("Application started.")
 
     app = QApplication(sys.argv)